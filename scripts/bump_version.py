@@ -18,31 +18,34 @@ PYPROJECT_VERSION_RE = re.compile(r'^(version\s*=\s*["\'])(\d+\.\d+\.\d+)(["\'])
 SEMVER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
 
 
-def _read_version(path: Path, pattern: re.Pattern[str]) -> str:
+def _read_version(path: Path, pattern: re.Pattern[str]) -> tuple[str, str]:
+    """Return (file text, current version) so the text can be reused on write."""
     text = path.read_text(encoding="utf-8")
     match = pattern.search(text)
     if not match:
         raise ValueError(f"Version not found in {path}")
-    return match.group(2)
+    return text, match.group(2)
 
 
-def _write_version(path: Path, pattern: re.Pattern[str], new_version: str) -> None:
-    text = path.read_text(encoding="utf-8")
-    updated, count = pattern.subn(
-        lambda m: f"{m.group(1)}{new_version}{m.group(3)}",
-        text,
-        count=1,
-    )
+def _write_version(
+    path: Path, pattern: re.Pattern[str], text: str, new_version: str
+) -> None:
+    # Backslashes are the only special characters in a replacement template.
+    escaped = new_version.replace("\\", r"\\")
+    replacement = rf"\g<1>{escaped}\g<3>"
+    updated, count = pattern.subn(replacement, text, count=1)
     if count != 1:
         raise ValueError(f"Failed to update version in {path}")
-    path.write_text(updated, encoding="utf-8")
+    if updated != text:
+        path.write_text(updated, encoding="utf-8")
 
 
 def _parse_semver(version: str) -> tuple[int, int, int]:
     match = SEMVER_RE.match(version)
     if not match:
         raise ValueError(f"Invalid version: {version} (expected X.Y.Z)")
-    return tuple(int(part) for part in match.groups())
+    major, minor, patch = match.groups()
+    return int(major), int(minor), int(patch)
 
 
 def _bump(version: str, bump: str) -> str:
@@ -56,33 +59,23 @@ def _bump(version: str, bump: str) -> str:
     raise ValueError(f"Unknown bump type: {bump}")
 
 
-def _git_available() -> bool:
+def _create_git_tag(version: str) -> None:
+    """Tag the release, using `git tag -l` both as repo probe and existence check."""
+    tag = f"v{version}"
     try:
-        subprocess.run(
-            ["git", "-C", str(ROOT), "rev-parse", "--git-dir"],
-            check=True,
-            stdout=subprocess.DEVNULL,
+        result = subprocess.run(
+            ["git", "-C", str(ROOT), "tag", "--list", tag],
+            check=False,
+            stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
+            text=True,
         )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
-
-
-def _git_tag_exists(tag: str) -> bool:
-    result = subprocess.run(
-        ["git", "-C", str(ROOT), "tag", "--list", tag],
-        check=False,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.DEVNULL,
-        text=True,
-    )
-    return tag in (result.stdout or "")
-
-
-def _create_git_tag(version: str) -> None:
-    tag = f"v{version}"
-    if _git_tag_exists(tag):
+    except FileNotFoundError:
+        result = None
+    if result is None or result.returncode != 0:
+        print("Git repository not found; skipping tag.")
+        return
+    if tag in (result.stdout or "").splitlines():
         print(f"Tag {tag} already exists; skipping.")
         return
     subprocess.run(["git", "-C", str(ROOT), "tag", tag], check=True)
@@ -114,8 +107,10 @@ def main() -> int:
     parser.set_defaults(tag=True)
     args = parser.parse_args()
 
-    meta_version = _read_version(META_FILE, META_VERSION_RE)
-    pyproject_version = _read_version(PYPROJECT_FILE, PYPROJECT_VERSION_RE)
+    meta_text, meta_version = _read_version(META_FILE, META_VERSION_RE)
+    pyproject_text, pyproject_version = _read_version(
+        PYPROJECT_FILE, PYPROJECT_VERSION_RE
+    )
     if meta_version != pyproject_version:
         print(
             f"Warning: version mismatch (meta={meta_version}, pyproject={pyproject_version})"
@@ -134,15 +129,12 @@ def main() -> int:
         print(f"Would set version to {new_version}")
         return 0
 
-    _write_version(META_FILE, META_VERSION_RE, new_version)
-    _write_version(PYPROJECT_FILE, PYPROJECT_VERSION_RE, new_version)
+    _write_version(META_FILE, META_VERSION_RE, meta_text, new_version)
+    _write_version(PYPROJECT_FILE, PYPROJECT_VERSION_RE, pyproject_text, new_version)
     print(f"Updated version to {new_version}")
 
     if args.tag:
-        if _git_available():
-            _create_git_tag(new_version)
-        else:
-            print("Git repository not found; skipping tag.")
+        _create_git_tag(new_version)
 
     return 0
 
@@ -1,13 +1,20 @@
 """Module entrypoint for `python -m src.app`."""
 
 import sys
+import threading
 
 from src.system import preload_cuda_libs
-from src.app import run_app
 
 
 def main():
-    preload_cuda_libs()
+    # Overlap CUDA library preloading with importing the Qt/app stack.
+    cuda_preload = threading.Thread(
+        target=preload_cuda_libs, name="cuda-preload", daemon=True
+    )
+    cuda_preload.start()
+    from src.app import run_app
+
+    cuda_preload.join()
     sys.exit(run_app())
 
 
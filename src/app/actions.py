@@ -1,9 +1,8 @@
 """UI actions and settings handlers."""
 
-import subprocess
 from typing import Optional
 
-from PyQt6.QtWidgets import QMessageBox, QSystemTrayIcon
+from PyQt6.QtWidgets import QSystemTrayIcon
 
 from ..config import APP_NAME, LOG_DIR, config
 from ..hotkeys import hotkey_manager, get_wayland_hotkey_instructions
@@ -17,6 +16,12 @@ logger = get_logger("app.ui")
 
 class UiActionsMixin:
     _model_worker: Optional[ModelLoadWorker]
+    _pending_model: Optional[str]
+    _settings_dialog: Optional[SettingsDialog]
+    _status_prefix: str
+
+    def _refresh_status_prefix(self):
+        self._status_prefix = f"Model: {config.settings.model_size} | "
 
     def _update_toggle_action(self):
         if self._tray:
@@ -24,6 +29,7 @@ class UiActionsMixin:
 
     def _on_model_select(self, model: str):
         config.update(model_size=model)
+        self._refresh_status_prefix()
         if self._tray:
             self._tray.set_model(model)
         if transcriber.current_model != model:
@@ -51,7 +57,17 @@ class UiActionsMixin:
         logger.info(f"Device changed to: {device}")
 
     def _start_model_load(self, model: str):
-        self._cleanup_model_worker()
+        if self._model_worker is not None and self._model_worker.isRunning():
+            # The transcriber loads one model at a time; a second worker would
+            # only fail. Load the latest selection once this one finishes.
+            self._pending_model = model
+            logger.info(f"Model load in progress, {model} queued")
+            return
+        self._pending_model = None
+        if transcriber.is_loaded and transcriber.current_model == model:
+            overlay_manager.show_success("Model ready")
+            return
+        # Backed by an mtime-checked directory listing, so this stays cheap.
         cached = is_model_cached(model)
         overlay_manager.show_downloading(
             0, model, status="loading_cached" if cached else "loading"
@@ -63,26 +79,37 @@ class UiActionsMixin:
             )
         )
         worker.finished_signal.connect(self._on_model_load_finished)
+        worker.finished.connect(self._on_model_worker_done)
+        worker.finished.connect(worker.deleteLater)
         worker.start()
         self._model_worker = worker
 
     def _on_model_load_finished(self, success: bool, error: str):
-        self._model_worker = None
+        if self._pending_model is not None:
+            return  # superseded; the queued model loads when the thread exits
         if success:
+            self._refresh_status_prefix()
             overlay_manager.show_success("Model ready")
             overlay_manager.set_status_detail(f"Model: {config.settings.model_size}")
         else:
             overlay_manager.show_error(error or "Model load failed")
 
-    def _cleanup_model_worker(self):
-        if hasattr(self, "_model_worker") and self._model_worker:
-            worker = self._model_worker
-            self._model_worker = None
-            if worker.isRunning():
-                worker.wait(100)
+    def _on_model_worker_done(self):
+        # QThread.finished: load_model has returned and released the transcriber.
+        self._model_worker = None
+        pending = self._pending_model
+        if pending is not None:
+            self._start_model_load(pending)
 
     def _show_settings(self):
-        dialog = SettingsDialog()
+        dialog = self._settings_dialog
+        if dialog is None:
+            # Built on first open (device probe, combo population), then reused.
+            dialog = self._settings_dialog = SettingsDialog()
+        elif dialog.isVisible():
+            dialog.raise_()
+            dialog.activateWindow()
+            return
         if dialog.exec():
             hotkey_manager.stop()
             hotkey_manager.set_callbacks(
@@ -90,15 +117,21 @@ class UiActionsMixin:
                 on_cancel=lambda: self.cancel_signal.emit(),
             )
             hotkey_manager.start()
+            self._refresh_status_prefix()
+            settings = config.settings
             if self._tray:
-                self._tray.set_model(config.settings.model_size)
-                self._tray.set_device(config.settings.device)
-            overlay_manager.set_theme(config.settings.overlay_theme)
-            overlay_manager.set_auto_paste(config.settings.auto_paste)
-            overlay_manager.set_opacity(config.settings.overlay_opacity)
+                self._tray.set_model(settings.model_size)
+                self._tray.set_device(settings.device)
+            overlay_manager.set_theme(settings.overlay_theme)
+            overlay_manager.set_auto_paste(settings.auto_paste)
+            overlay_manager.set_opacity(settings.overlay_opacity)
 
     def _open_logs_folder(self):
+        import subprocess
+
         subprocess.Popen(["xdg-open", str(LOG_DIR)])
 
     def _show_hotkey_info(self):
+        from PyQt6.QtWidgets import QMessageBox
+
         QMessageBox.information(None, "Hotkey Setup", get_wayland_hotkey_instructions())
@@ -3,9 +3,8 @@
 from PyQt6.QtWidgets import QSystemTrayIcon
 
 from ..audio import recorder
-from ..injector import injector
 from ..ui import overlay_manager
-from .workers import TranscriptionWorker, RealtimeTranscriptionWorker
+from .workers import TranscriptionWorker
 from ..model import transcriber
 from ..config import APP_NAME, SAMPLE_RATE, config
 from ..logging_utils import get_logger
@@ -22,14 +21,10 @@ class RecordingMixin:
     def _on_audio_chunk(self, audio_data):
         if not self._recording:
             return
-        self._cleanup_realtime_worker()
-        worker = RealtimeTranscriptionWorker(audio_data, parent=self)
-        worker.partial_result.connect(self._on_realtime_partial)
-        worker.finished.connect(self._on_realtime_worker_finished)
-        worker.start()
-        self._realtime_worker = worker
+        self._realtime_service.submit(audio_data)
         logger.debug(
-            f"Realtime transcription started for {len(audio_data)/16000:.1f}s chunk"
+            "Realtime transcription queued for %.1fs chunk",
+            len(audio_data) / SAMPLE_RATE,
         )
 
     def _on_realtime_partial(self, text: str):
@@ -37,25 +32,6 @@ class RecordingMixin:
             overlay_manager.show_transcribing(text)
             overlay_manager.update_partial_text(text)
 
-    def _on_realtime_worker_finished(self):
-        pass
-
-    def _cleanup_realtime_worker(self, wait: bool = False):
-        if self._realtime_worker is not None:
-            worker = self._realtime_worker
-            self._realtime_worker = None
-            try:
-                if hasattr(worker, "cancel"):
-                    worker.cancel()
-                if worker.isRunning():
-                    if wait:
-                        worker.wait(2000)
-                    worker.finished.connect(worker.deleteLater)
-                else:
-                    worker.deleteLater()
-            except RuntimeError:
-                pass
-
     def _on_toggle(self):
         if self._processing:
             logger.debug("Processing in progress, ignoring toggle")
@@ -67,15 +43,13 @@ class RecordingMixin:
 
     def _on_cancel(self):
         if self._recording:
-            self._cleanup_realtime_worker()
+            self._realtime_service.cancel()
             recorder.cancel()
             self._recording = False
             self._update_toggle_action()
             if self._tray:
                 self._tray.set_recording_indicator(False)
-            overlay_manager.set_status_detail(
-                f"Model: {config.settings.model_size} | Cancelled"
-            )
+            overlay_manager.set_status_detail(self._status_prefix + "Cancelled")
             overlay_manager.set_stats("")
             logger.info("Recording cancelled")
         else:
@@ -89,10 +63,12 @@ class RecordingMixin:
         if self._recording:
             return
         recorder.set_callbacks(
+            # The recorder already limits level updates to one per 50 ms.
             on_audio_level=lambda level: self.audio_level_signal.emit(level),
             on_silence_timeout=lambda: self.silence_timeout_signal.emit(),
             on_audio_chunk=lambda a: self.audio_chunk_signal.emit(a),
         )
+        recorder.set_level_enabled(True)
         if recorder.start():
             self._recording = True
             self._update_toggle_action()
@@ -102,7 +78,7 @@ class RecordingMixin:
             overlay_manager.show_recording()
             self._last_duration = 0.0
             overlay_manager.set_status_detail(
-                f"Model: {config.settings.model_size} | Recording (Esc to cancel)"
+                self._status_prefix + "Recording (Esc to cancel)"
             )
             overlay_manager.set_stats("Listening... (Esc to cancel)")
             overlay_manager.set_hints("")
@@ -113,34 +89,33 @@ class RecordingMixin:
     def _stop_recording(self):
         if not self._recording:
             return
-        self._cleanup_realtime_worker(wait=True)
+        self._realtime_service.cancel(wait=True)
         audio = recorder.stop()
         self._recording = False
         self._update_toggle_action()
         if self._tray:
             self._tray.set_recording_indicator(False)
         overlay_manager.set_recording_state(False)
-        if audio is None or len(audio) < 1600:
+        samples = 0 if audio is None else len(audio)
+        if samples < SAMPLE_RATE // 10:
             overlay_manager.show_error("No audio recorded")
             return
-        self._process_audio(audio)
+        self._process_audio(audio, samples)
 
-    def _process_audio(self, audio):
+    def _process_audio(self, audio, samples: int):
         self._processing = True
         self._update_toggle_action(False)
         if self._tray:
             self._tray.set_recording_indicator(False)
         overlay_manager.set_recording_state(False)
         overlay_manager.show_transcribing()
-        clip_duration = len(audio) / SAMPLE_RATE
+        clip_duration = samples / SAMPLE_RATE
         self._last_duration = clip_duration
         overlay_manager.set_hints("")
         device = transcriber.current_device or config.settings.device
-        overlay_manager.set_status_detail(
-            f"Model: {config.settings.model_size} | Transcribing"
-        )
+        overlay_manager.set_status_detail(self._status_prefix + "Transcribing")
         overlay_manager.set_stats(f"Clip: {clip_duration:.1f}s | Device: {device}")
-        logger.debug(f"Processing audio: {len(audio)} samples ({clip_duration:.2f}s)")
+        logger.debug("Processing audio: %d samples (%.2fs)", samples, clip_duration)
         worker = TranscriptionWorker(audio, parent=self)
         worker.finished_signal.connect(self._on_transcription_done)
         worker.progress_signal.connect(self._on_transcription_progress)
@@ -159,16 +134,20 @@ class RecordingMixin:
             self._worker_thread = None
 
     def _on_transcription_progress(self, status: str, percent: float):
+        model = config.settings.model_size
         if status in ("downloading", "loading", "initializing", "loading_cached"):
-            overlay_manager.set_status_detail(
-                f"Model: {config.settings.model_size} | Preparing"
-            )
-            overlay_manager.show_downloading(
-                percent, config.settings.model_size, status=status
+            overlay_manager.update_downloading(
+                percent,
+                model,
+                status=status,
+                detail=self._status_prefix + "Preparing",
             )
         elif status == "fallback_cpu":
-            overlay_manager.show_downloading(
-                percent, config.settings.model_size, status=status
+            overlay_manager.update_downloading(
+                percent,
+                model,
+                status=status,
+                detail=self._status_prefix + "GPU unavailable, loading on CPU",
             )
             if self._tray:
                 self._tray.notify(
@@ -177,9 +156,6 @@ class RecordingMixin:
                     QSystemTrayIcon.MessageIcon.Warning,
                     2000,
                 )
-            overlay_manager.set_status_detail(
-                f"Model: {config.settings.model_size} | GPU unavailable, loading on CPU"
-            )
 
     def _on_transcription_done(self, result, error: str):
         self._processing = False
@@ -195,9 +171,12 @@ class RecordingMixin:
         if not result or not result.text:
             overlay_manager.show_error("Empty result")
             return
+        auto_paste = config.settings.auto_paste
         overlay_manager.set_text(result.text)
         injected = False
-        if config.settings.auto_paste:
+        if auto_paste:
+            from ..injector import injector
+
             success, message = injector.inject(result.text)
             injected = success
             if success:
@@ -213,19 +192,16 @@ class RecordingMixin:
             overlay_manager.show_success("Ready")
         overlay_manager.set_hints("")
         state_text = (
-            "Inserted"
-            if injected
-            else ("Not inserted" if config.settings.auto_paste else "Ready")
-        )
-        overlay_manager.set_status_detail(
-            f"Model: {config.settings.model_size} | {state_text}"
+            "Inserted" if injected else ("Not inserted" if auto_paste else "Ready")
         )
+        overlay_manager.set_status_detail(self._status_prefix + state_text)
         duration = result.duration or getattr(self, "_last_duration", 0.0)
         stats_parts = []
         if duration:
             stats_parts.append(f"Duration: {duration:.1f}s")
-        if transcriber.current_device:
-            stats_parts.append(f"Device: {transcriber.current_device}")
+        device = transcriber.current_device
+        if device:
+            stats_parts.append(f"Device: {device}")
         if result.language:
             stats_parts.append(f"Lang: {result.language}")
         overlay_manager.set_stats(" | ".join(stats_parts) if stats_parts else "")
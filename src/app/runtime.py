@@ -17,6 +17,7 @@ from ..config import (
     is_wayland,
 )
 from ..meta import APP_VERSION
+from ..audio import recorder
 from ..hotkeys import hotkey_manager
 from ..ipc_server import IpcServer
 from ..logging_utils import setup_logging, get_logger
@@ -24,16 +25,20 @@ from ..system import acquire_lock, release_lock
 from ..ui import overlay_manager, TrayController
 from .recording import RecordingMixin
 from .actions import UiActionsMixin
+from .workers import RealtimeTranscriptionService
 
 logger = get_logger("app")
 
+# A live IpcServer on loopback answers within a few milliseconds.
+IPC_PROBE_TIMEOUT_MS = 150
+
 
 class WhisperApp(QObject, RecordingMixin, UiActionsMixin):
     toggle_signal = pyqtSignal()
     cancel_signal = pyqtSignal()
     audio_level_signal = pyqtSignal(float)
     silence_timeout_signal = pyqtSignal()
-    audio_chunk_signal = pyqtSignal(object)
+    audio_chunk_signal = pyqtSignal("PyQt_PyObject")  # ndarray passed by reference
 
     def __init__(self):
         super().__init__()
@@ -44,14 +49,18 @@ class WhisperApp(QObject, RecordingMixin, UiActionsMixin):
         self._recording = False
         self._processing = False
         self._worker_thread = None
-        self._realtime_worker = None
+        self._realtime_service = RealtimeTranscriptionService(parent=self)
         self._model_worker = None
+        self._pending_model = None
+        self._settings_dialog = None
+        self._refresh_status_prefix()
 
         self.toggle_signal.connect(self._on_toggle)
         self.cancel_signal.connect(self._on_cancel)
         self.audio_level_signal.connect(self._on_audio_level)
         self.silence_timeout_signal.connect(self._on_silence_timeout)
         self.audio_chunk_signal.connect(self._on_audio_chunk)
+        self._realtime_service.partial_result.connect(self._on_realtime_partial)
 
     def _on_audio_level(self, level: float):
         overlay_manager.update_audio_level(level)
@@ -101,10 +110,12 @@ class WhisperApp(QObject, RecordingMixin, UiActionsMixin):
     def _attempt_toggle_running_instance(self) -> bool:
         socket = QLocalSocket()
         socket.connectToServer(IPC_SOCKET_NAME)
-        if socket.waitForConnected(1000):
+        if socket.state() == QLocalSocket.LocalSocketState.UnconnectedState:
+            # Refused or missing socket: stale lock, nothing to wait for.
+            return False
+        if socket.waitForConnected(IPC_PROBE_TIMEOUT_MS):
             socket.write(b"toggle")
             socket.flush()
-            socket.waitForBytesWritten(1000)
             socket.disconnectFromServer()
             logger.info("Sent toggle to running instance")
             return True
@@ -113,10 +124,9 @@ class WhisperApp(QObject, RecordingMixin, UiActionsMixin):
     def _quit(self):
         logger.info("Quitting...")
         if self._recording:
-            from ..audio import recorder
-
             recorder.cancel()
-        self._cleanup_realtime_worker(wait=True)
+        self._realtime_service.stop()
+        self._realtime_service.wait(2000)
         if self._model_worker and self._model_worker.isRunning():
             self._model_worker.wait(500)
         if self._worker_thread is not None:
@@ -143,19 +153,21 @@ class WhisperApp(QObject, RecordingMixin, UiActionsMixin):
         )
 
         self._lock_handle = acquire_lock(LOCK_FILE)
-        if not self._lock_handle:
+        if self._lock_handle is None:
             return 0 if self._attempt_toggle_running_instance() else 1
 
         self._app = QApplication(sys.argv)
         self._app.setApplicationName(APP_NAME)
         self._app.setQuitOnLastWindowClosed(False)
 
+        settings = config.settings
         overlay_manager.initialize()
-        overlay_manager.set_theme(config.settings.overlay_theme)
-        overlay_manager.set_auto_paste(config.settings.auto_paste)
-        overlay_manager.set_opacity(config.settings.overlay_opacity)
+        overlay_manager.set_theme(settings.overlay_theme)
+        overlay_manager.set_auto_paste(settings.auto_paste)
+        overlay_manager.set_opacity(settings.overlay_opacity)
         self._setup_tray()
         self._start_ipc()
+        self._realtime_service.start()
         self._setup_hotkeys(
             on_copy=self._copy_last_result,
             on_paste=self._paste_last_result,
@@ -168,7 +180,7 @@ class WhisperApp(QObject, RecordingMixin, UiActionsMixin):
             on_auto_paste_change=self._on_auto_paste_toggle,
         )
         overlay_manager.set_toggle_action(on_toggle=lambda: self.toggle_signal.emit())
-        self._start_model_load(config.settings.model_size)
+        self._start_model_load(settings.model_size)
 
         logger.info("Application ready")
         return self._app.exec()
@@ -189,9 +201,10 @@ class WhisperApp(QObject, RecordingMixin, UiActionsMixin):
         # Reuse injector to paste current text
         if overlay_manager.overlay and overlay_manager.overlay._text_view:
             text = overlay_manager.overlay._text_view.toPlainText()
-            from ..injector import injector
+            from ..injector import PASTE_FOCUS_DELAY, injector
 
-            success, msg = injector.inject(text)
+            # Ctrl+Alt may still be held, or the overlay may still have focus.
+            success, msg = injector.inject(text, focus_delay=PASTE_FOCUS_DELAY)
             if success and msg:
                 overlay_manager.show_success(msg)
             elif not success:
@@ -199,6 +212,7 @@ class WhisperApp(QObject, RecordingMixin, UiActionsMixin):
 
     def _hide_overlay(self):
         overlay_manager.hide()
+        recorder.set_level_enabled(False)
 
     def _on_auto_paste_toggle(self, enabled: bool):
         config.update(auto_paste=enabled)
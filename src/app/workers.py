@@ -1,17 +1,19 @@
 """Background workers for transcription and model loading."""
 
+import queue
+import threading
 from typing import Optional
 
+import numpy as np
 from PyQt6.QtCore import QThread, pyqtSignal, QObject
 
 from ..logging_utils import get_logger
-from ..model import transcriber
 
 logger = get_logger("workers")
 
 
 class TranscriptionWorker(QThread):
-    finished_signal = pyqtSignal(object, str)  # result, error
+    finished_signal = pyqtSignal("PyQt_PyObject", str)  # result, error
     progress_signal = pyqtSignal(str, float)  # status, percent
     partial_signal = pyqtSignal(str)  # partial text for real-time display
 
@@ -20,6 +22,8 @@ class TranscriptionWorker(QThread):
         self.audio_data = audio_data
 
     def run(self):
+        from ..model import transcriber
+
         try:
             logger.debug("Transcription worker started")
             if not transcriber.is_loaded:
@@ -35,7 +39,7 @@ class TranscriptionWorker(QThread):
             )
 
             if result and result.text:
-                logger.debug(f"Transcription complete: {result.text[:50]}...")
+                logger.debug("Transcription complete: %.50s...", result.text)
                 self.finished_signal.emit(result, "")
             else:
                 logger.warning("Transcription returned empty")
@@ -45,34 +49,66 @@ class TranscriptionWorker(QThread):
             self.finished_signal.emit(None, str(e))
 
 
-class RealtimeTranscriptionWorker(QThread):
+class RealtimeTranscriptionService(QThread):
+    """Long-lived worker that transcribes the latest submitted audio chunk."""
+
     partial_result = pyqtSignal(str)
 
-    def __init__(self, audio_data, parent: Optional[QObject] = None):
+    def __init__(self, parent: Optional[QObject] = None):
         super().__init__(parent)
-        self.audio_data = audio_data
-        self._cancelled = False
-
-    def cancel(self):
-        self._cancelled = True
+        self._queue: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=1)
+        self._idle = threading.Event()
+        self._idle.set()
+        self._cancelled = threading.Event()
+
+    def submit(self, audio_data) -> None:
+        """Queue a chunk, replacing any chunk that has not been picked up yet."""
+        self._cancelled.clear()
+        self._drain()
+        self._queue.put_nowait(audio_data)
+
+    def cancel(self, wait: bool = False) -> None:
+        """Drop pending chunks and abort the one in flight."""
+        self._cancelled.set()
+        self._drain()
+        if wait:
+            self._idle.wait(2.0)
+
+    def stop(self) -> None:
+        self.cancel()
+        self._queue.put_nowait(None)
+
+    def _drain(self) -> None:
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            pass
 
     def run(self):
-        if self._cancelled:
-            return
-
-        try:
-            if not transcriber.is_loaded:
-                transcriber.load_model()
+        from ..model import transcriber
 
-            if self._cancelled:
+        while True:
+            audio_data = self._queue.get()
+            if audio_data is None:
                 return
+            self._idle.clear()
+            try:
+                if not transcriber.is_loaded:
+                    transcriber.load_model()
 
-            result = transcriber.transcribe(self.audio_data)
+                if self._cancelled.is_set():
+                    continue
 
-            if result and result.text and not self._cancelled:
-                self.partial_result.emit(result.text)
-        except Exception as e:
-            logger.debug(f"Realtime transcription error: {e}")
+                result = transcriber.transcribe(
+                    audio_data, abort_callback=self._cancelled.is_set, preview=True
+                )
+
+                if result and result.text and not self._cancelled.is_set():
+                    self.partial_result.emit(result.text)
+            except Exception as e:
+                logger.debug("Realtime transcription error: %s", e)
+            finally:
+                self._idle.set()
 
 
 class ModelLoadWorker(QThread):
@@ -85,12 +121,20 @@ class ModelLoadWorker(QThread):
         self.device = device
 
     def run(self):
+        if self.isInterruptionRequested():
+            return
+
+        from ..model import transcriber
+
         try:
             success = transcriber.load_model(
                 model_name=self.model_name,
                 device=self.device,
                 progress_callback=lambda s, p: self.progress_signal.emit(s, p),
             )
+            if success:
+                # Pay CTranslate2's first-call setup here, not on the first recording.
+                transcriber.warm_up()
             self.finished_signal.emit(
                 bool(success), "" if success else "Model load failed"
             )
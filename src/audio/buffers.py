@@ -0,0 +1,82 @@
+"""Preallocated float32 buffers for audio capture."""
+
+import numpy as np
+
+
+class AudioArena:
+    """Append-only float32 buffer with O(1) length and a contiguous view."""
+
+    def __init__(self, capacity: int):
+        self._data = np.empty(max(1, capacity), dtype=np.float32)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, frame: np.ndarray) -> None:
+        """Copy a frame into the arena, growing it if the capacity is exceeded."""
+        end = self._size + frame.shape[0]
+        if end > self._data.shape[0]:
+            self._grow(end)
+        self._data[self._size : end] = frame
+        self._size = end
+
+    def view(self) -> np.ndarray:
+        """Return the recorded samples without copying."""
+        return self._data[: self._size]
+
+    def _grow(self, min_capacity: int) -> None:
+        data = np.empty(max(min_capacity, self._data.shape[0] * 2), dtype=np.float32)
+        data[: self._size] = self._data[: self._size]
+        self._data = data
+
+
+class RingBuffer:
+    """Fixed-capacity float32 ring that keeps the most recent samples."""
+
+    def __init__(self, capacity: int):
+        self._data = np.empty(max(1, capacity), dtype=np.float32)
+        self._write = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, frame: np.ndarray) -> None:
+        """Copy a frame in, overwriting the oldest samples once full."""
+        capacity = self._data.shape[0]
+        n = frame.shape[0]
+        if n >= capacity:
+            self._data[:] = frame[-capacity:]
+            self._write, self._size = 0, capacity
+            return
+        start, end = self._write, self._write + n
+        if end <= capacity:
+            self._data[start:end] = frame
+        else:
+            split = capacity - start
+            self._data[start:] = frame[:split]
+            self._data[: end - capacity] = frame[split:]
+        self._write = end % capacity
+        self._size = min(capacity, self._size + n)
+
+    def drain_into(self, arena: AudioArena) -> None:
+        """Append buffered samples to the arena in order and empty the ring."""
+        for segment in self._segments():
+            arena.append(segment)
+        self.clear()
+
+    def to_array(self) -> np.ndarray:
+        """Return a copy of the buffered samples in chronological order."""
+        return np.concatenate(self._segments())
+
+    def clear(self) -> None:
+        self._write = 0
+        self._size = 0
+
+    def _segments(self) -> tuple:
+        capacity = self._data.shape[0]
+        start = (self._write - self._size) % capacity
+        if start + self._size <= capacity:
+            return (self._data[start : start + self._size],)
+        return (self._data[start:], self._data[: self._write])
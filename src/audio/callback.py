@@ -1,13 +1,16 @@
 """Audio callback processing logic."""
 
+import logging
 import time
-from typing import Optional, Callable, List
+from typing import Optional, Callable
 import numpy as np
 
-from ..config import SAMPLE_RATE, config
+from ..config import SAMPLE_RATE
 from ..logging_utils import get_logger
 from .vad import VADProcessor
+from .buffers import AudioArena, RingBuffer
 from .chunks import emit_chunk_if_ready
+from .levels import frame_peak, frame_rms
 
 logger = get_logger("audio.callback")
 
@@ -27,42 +30,63 @@ class CallbackState:
         self.level_update_interval: float = 0.05
         self.last_activity_time: float = 0
         self.chunk_interval: float = 2.0
-        self.last_chunk_time: float = 0
         self.last_chunk_index: int = 0
+        self.silence_timeout: float = 1.5
+        self.max_recording_sec: Optional[float] = None
+        self.max_samples: int = 0
 
     def reset(self):
         self.__init__()
 
+    def configure(
+        self, silence_timeout: float, max_recording_sec: Optional[float]
+    ) -> None:
+        """Snapshot settings used on every frame so the callback skips config lookups."""
+        self.silence_timeout = silence_timeout
+        self.max_recording_sec = max_recording_sec
+        self.max_samples = int(SAMPLE_RATE * (max_recording_sec or 0))
+
 
 def process_audio_callback(
     audio: np.ndarray,
     state: CallbackState,
     vad: Optional[VADProcessor],
-    pre_buffer,
-    main_buffer: List[np.ndarray],
+    pre_buffer: RingBuffer,
+    main_buffer: AudioArena,
     on_audio_level: Optional[Callable[[float], None]],
     on_speech_start: Optional[Callable[[], None]],
     on_silence_timeout: Optional[Callable[[], None]],
     on_audio_chunk: Optional[Callable[[np.ndarray], None]],
 ) -> None:
     """Process a single audio callback frame."""
-    current_time = time.time()
-    rms = float(np.sqrt(np.mean(audio**2)))
+    if state.timeout_triggered:
+        # The app is already stopping this recording. Frames until stop() are
+        # still kept, as before, but VAD, levels and chunking are skipped.
+        main_buffer.append(audio)
+        return
+    current_time = time.monotonic()
 
     if state.last_activity_time == 0:
         state.last_activity_time = current_time
 
+    # With VAD, RMS is only needed for level updates and speech frames, so the
+    # VAD branch computes it lazily when no level update is due.
+    rms: Optional[float] = None
     if (
         on_audio_level
         and (current_time - state.last_level_update) >= state.level_update_interval
     ):
-        on_audio_level(float(rms))
+        rms = frame_rms(audio)
+        on_audio_level(rms)
         state.last_level_update = current_time
+    elif vad is None:
+        rms = frame_rms(audio)
 
-    if np.abs(audio).max() > 0.99:
+    # The peak only feeds this debug message, so skip it unless it will be logged.
+    if logger.isEnabledFor(logging.DEBUG) and frame_peak(audio) > 0.99:
         logger.debug("Audio clipping detected")
 
-    if config.settings.vad_enabled and vad is not None:
+    if vad is not None:
         _process_vad(
             audio,
             rms,
@@ -87,7 +111,7 @@ def process_audio_callback(
         )
 
     _check_timeouts(current_time, state, main_buffer, on_silence_timeout)
-    _emit_chunks(current_time, state, main_buffer, on_audio_chunk)
+    _emit_chunks(state, main_buffer, on_audio_chunk)
 
 
 def _process_vad(
@@ -101,8 +125,7 @@ def _process_vad(
     on_speech_start,
     on_silence_timeout,
 ):
-    audio_int16 = (audio * 32767).astype(np.int16)
-    is_speech = vad.is_speech(audio_int16.tobytes())
+    is_speech = vad.is_speech_frame(audio)
 
     if is_speech:
         if not state.speech_detected:
@@ -110,28 +133,28 @@ def _process_vad(
             logger.debug("Speech started")
             if on_speech_start:
                 on_speech_start()
-            for prebuf in pre_buffer:
-                main_buffer.append(prebuf)
-            pre_buffer.clear()
+            pre_buffer.drain_into(main_buffer)
         state.silence_start = None
-        main_buffer.append(audio.copy())
+        main_buffer.append(audio)
+        if rms is None:
+            rms = frame_rms(audio)
         if rms >= NON_VAD_SPEECH_STOP:
             state.last_activity_time = current_time
     else:
         if state.speech_detected:
             if state.silence_start is None:
-                state.silence_start = time.time()
-            silence_duration = time.time() - state.silence_start
-            timeout = config.settings.vad_silence_timeout
+                state.silence_start = current_time
+            silence_duration = current_time - state.silence_start
+            timeout = state.silence_timeout
             if silence_duration >= timeout and not state.timeout_triggered:
-                logger.debug(f"Silence timeout ({timeout}s)")
+                logger.debug("Silence timeout (%ss)", timeout)
                 state.timeout_triggered = True
                 if on_silence_timeout:
                     on_silence_timeout()
             else:
-                main_buffer.append(audio.copy())
+                main_buffer.append(audio)
         else:
-            pre_buffer.append(audio.copy())
+            pre_buffer.push(audio)
 
 
 def _process_non_vad(
@@ -149,55 +172,50 @@ def _process_non_vad(
             state.speech_detected = True
             if on_speech_start:
                 on_speech_start()
-            for prebuf in pre_buffer:
-                main_buffer.append(prebuf)
-            pre_buffer.clear()
+            pre_buffer.drain_into(main_buffer)
         state.silence_start_nonvad = None
-        main_buffer.append(audio.copy())
+        main_buffer.append(audio)
         state.last_activity_time = current_time
     elif state.speech_detected:
         if state.silence_start_nonvad is None:
             state.silence_start_nonvad = current_time
         elif (
             current_time - state.silence_start_nonvad
-        ) >= config.settings.vad_silence_timeout and not state.timeout_triggered:
+        ) >= state.silence_timeout and not state.timeout_triggered:
             state.timeout_triggered = True
             if on_silence_timeout:
                 on_silence_timeout()
-        main_buffer.append(audio.copy())
+        main_buffer.append(audio)
     else:
-        pre_buffer.append(audio.copy())
+        pre_buffer.push(audio)
 
 
 def _check_timeouts(current_time, state, main_buffer, on_silence_timeout):
-    if not state.timeout_triggered and config.settings.max_recording_sec:
-        total_samples = sum(len(buf) for buf in main_buffer)
-        max_samples = SAMPLE_RATE * config.settings.max_recording_sec
-        if total_samples >= max_samples:
+    if not state.timeout_triggered and state.max_samples:
+        if len(main_buffer) >= state.max_samples:
             logger.warning(
-                f"Max recording duration ({config.settings.max_recording_sec}s) reached"
+                "Max recording duration (%ss) reached", state.max_recording_sec
             )
             state.timeout_triggered = True
             if on_silence_timeout:
                 on_silence_timeout()
 
     if state.speech_detected and not state.timeout_triggered:
-        if (
-            current_time - state.last_activity_time
-        ) >= config.settings.vad_silence_timeout:
+        if (current_time - state.last_activity_time) >= state.silence_timeout:
             state.timeout_triggered = True
             if on_silence_timeout:
                 on_silence_timeout()
 
 
-def _emit_chunks(current_time, state, main_buffer, on_audio_chunk):
+def _emit_chunks(state, main_buffer, on_audio_chunk):
     if on_audio_chunk and state.speech_detected:
-        state.last_chunk_time, state.last_chunk_index = emit_chunk_if_ready(
-            buffers=main_buffer,
-            last_time=state.last_chunk_time,
+        state.last_chunk_index = emit_chunk_if_ready(
+            audio=main_buffer.view(),
             last_index=state.last_chunk_index,
-            current_time=current_time,
             chunk_interval=state.chunk_interval,
             sample_rate=SAMPLE_RATE,
             on_audio_chunk=on_audio_chunk,
+            # The arena is append-only and replaced per recording, so the
+            # emitted prefix never changes under the consumer.
+            copy=False,
         )
@@ -1,31 +1,36 @@
 """Utilities for emitting audio chunks during recording."""
 
-from typing import List, Tuple
-
 import numpy as np
 
 
 def emit_chunk_if_ready(
-    buffers: List[np.ndarray],
-    last_time: float,
+    audio: np.ndarray,
     last_index: int,
-    current_time: float,
     chunk_interval: float,
     sample_rate: int,
     on_audio_chunk,
-) -> Tuple[float, int]:
+    copy: bool = True,
+) -> int:
     """
-    Emit concatenated audio if enough time and samples have accumulated.
+    Emit the audio recorded so far once more than a second has accumulated
+    (the first chunk, last_index == 0) or once chunk_interval of new audio
+    (and more than a second) has accumulated since last_index.
 
-    Returns updated (last_time, last_index).
+    `audio` is the contiguous recording (typically an arena view), so the
+    sample count is O(1). Pass copy=False only when the recorded prefix is
+    never written again, e.g. an AudioArena; the callback then receives a
+    view. Returns the updated last_index.
     """
-    if current_time - last_time < chunk_interval:
-        return last_time, last_index
-
-    total_samples = sum(len(buf) for buf in buffers)
-    if total_samples <= last_index + sample_rate:
-        return last_time, last_index
+    # Counting samples rather than comparing clock readings keeps the cadence
+    # tied to the audio actually captured.
+    total_samples = audio.shape[0]
+    new_samples = total_samples - last_index
+    if new_samples <= sample_rate:
+        return last_index
+    # The first preview only waits for a second of audio, as it did when the
+    # gate compared clock readings against last_chunk_time = 0.
+    if last_index and new_samples < int(chunk_interval * sample_rate):
+        return last_index
 
-    all_audio = np.concatenate(buffers)
-    on_audio_chunk(all_audio.copy())
-    return current_time, len(all_audio)
+    on_audio_chunk(audio.copy() if copy else audio)
+    return total_samples
@@ -2,6 +2,11 @@
 
 from typing import List, Optional
 
+try:
+    import sounddevice as sd
+except (ImportError, OSError):  # missing package or PortAudio library
+    sd = None
+
 from ..config import SAMPLE_RATE
 from ..logging_utils import get_logger
 
@@ -10,9 +15,10 @@ logger = get_logger("audio.devices")
 
 def list_devices() -> List[dict]:
     """List available audio input devices."""
+    if sd is None:
+        logger.error("Failed to list devices: sounddevice is not available")
+        return []
     try:
-        import sounddevice as sd
-
         devices = sd.query_devices()
         inputs = []
         for i, dev in enumerate(devices):
@@ -33,9 +39,9 @@ def list_devices() -> List[dict]:
 
 def get_default_device() -> Optional[int]:
     """Get default input device index."""
+    if sd is None:
+        return None
     try:
-        import sounddevice as sd
-
         return sd.default.device[0]
     except Exception:
         return None
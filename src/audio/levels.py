@@ -0,0 +1,16 @@
+"""Per-frame audio level measurements."""
+
+import numpy as np
+
+
+def frame_rms(audio: np.ndarray) -> float:
+    """Return the RMS of a float32 frame without allocating a squared copy."""
+    n = audio.shape[0]
+    if n == 0:
+        return 0.0
+    return float(np.sqrt(np.dot(audio, audio) / n))
+
+
+def frame_peak(audio: np.ndarray) -> float:
+    """Return the peak magnitude of a frame without allocating np.abs(audio)."""
+    return max(float(audio.max()), -float(audio.min()))
@@ -1,8 +1,7 @@
 """Audio recording with VAD support and chunk callbacks."""
 
-import collections
 import threading
-from typing import Optional, Callable, List
+from typing import Optional, Callable
 import numpy as np
 from ..config import SAMPLE_RATE, PRE_BUFFER_MS, config
 from ..logging_utils import get_logger
@@ -10,11 +9,17 @@ from .vad import VADProcessor
 from .devices import list_devices
 from .stream import open_stream_with_fallback
 from .callback import CallbackState, process_audio_callback
+from .buffers import AudioArena, RingBuffer
+from .levels import frame_rms
 
 logger = get_logger("audio.recorder")
 PRE_BUFFER_FRAMES = int(SAMPLE_RATE * PRE_BUFFER_MS / 1000)
 VAD_FRAME_MS = 30
 VAD_FRAME_SAMPLES = int(SAMPLE_RATE * VAD_FRAME_MS / 1000)
+# Whole VAD frames, one more than fits in PRE_BUFFER_MS (6720 samples at 16 kHz).
+PRE_BUFFER_SAMPLES = (PRE_BUFFER_FRAMES // VAD_FRAME_SAMPLES + 1) * VAD_FRAME_SAMPLES
+# Initial arena size when no hard cap is set; the arena grows past it if needed.
+DEFAULT_ARENA_SEC = 120
 
 
 class AudioRecorder:
@@ -22,16 +27,15 @@ class AudioRecorder:
         self._stream = None
         self._recording = False
         self._lock = threading.Lock()
-        self._pre_buffer: collections.deque = collections.deque(
-            maxlen=PRE_BUFFER_FRAMES // VAD_FRAME_SAMPLES + 1
-        )
-        self._main_buffer: List[np.ndarray] = []
+        self._pre_buffer = RingBuffer(PRE_BUFFER_SAMPLES)
+        self._main_buffer = AudioArena(0)
         self._vad: Optional[VADProcessor] = None
         self._state = CallbackState()
         self._on_audio_level: Optional[Callable[[float], None]] = None
         self._on_speech_start: Optional[Callable[[], None]] = None
         self._on_silence_timeout: Optional[Callable[[], None]] = None
         self._on_audio_chunk: Optional[Callable[[np.ndarray], None]] = None
+        self._level_enabled = True
 
     def set_callbacks(
         self,
@@ -45,13 +49,31 @@ class AudioRecorder:
         self._on_silence_timeout = on_silence_timeout
         self._on_audio_chunk = on_audio_chunk
 
+    @staticmethod
+    def _arena_capacity() -> int:
+        max_sec = config.settings.max_recording_sec or DEFAULT_ARENA_SEC
+        return int(SAMPLE_RATE * max_sec) + PRE_BUFFER_SAMPLES + VAD_FRAME_SAMPLES
+
+    def set_level_enabled(self, enabled: bool) -> None:
+        """Turn audio level reporting on/off, e.g. while no level meter is shown."""
+        self._level_enabled = enabled
+
+    def _warm_up(self) -> None:
+        """Run the per-frame code once so the first audio callback skips setup costs."""
+        frame = np.zeros(VAD_FRAME_SAMPLES, dtype=np.float32)
+        frame_rms(frame)
+        if self._vad is not None:
+            self._vad.is_speech_frame(frame)
+
     def _audio_callback(self, indata, frames, time_info, status):
         if status:
-            logger.warning(f"Audio status: {status}")
+            logger.warning("Audio status: %s", status)
         if not self._recording:
             return
-        audio = indata[:, 0] if indata.ndim > 1 else indata.flatten()
-        audio = audio.astype(np.float32)
+        # The stream is opened mono float32, so this is a view without a copy.
+        audio = indata[:, 0]
+        if audio.dtype != np.float32:
+            audio = audio.astype(np.float32)
 
         process_audio_callback(
             audio=audio,
@@ -59,7 +81,7 @@ class AudioRecorder:
             vad=self._vad,
             pre_buffer=self._pre_buffer,
             main_buffer=self._main_buffer,
-            on_audio_level=self._on_audio_level,
+            on_audio_level=self._on_audio_level if self._level_enabled else None,
             on_speech_start=self._on_speech_start,
             on_silence_timeout=self._on_silence_timeout,
             on_audio_chunk=self._on_audio_chunk,
@@ -71,13 +93,17 @@ class AudioRecorder:
                 logger.warning("Already recording")
                 return False
             self._pre_buffer.clear()
-            self._main_buffer.clear()
+            self._main_buffer = AudioArena(self._arena_capacity())
             self._state.reset()
+            self._state.configure(
+                config.settings.vad_silence_timeout, config.settings.max_recording_sec
+            )
             self._vad = (
-                VADProcessor(config.settings.vad_threshold)
+                VADProcessor(config.settings.vad_threshold, VAD_FRAME_SAMPLES)
                 if config.settings.vad_enabled
                 else None
             )
+            self._warm_up()
             resolved_device = device
             if resolved_device is None and config.settings.microphone:
                 for dev in list_devices():
@@ -109,21 +135,15 @@ class AudioRecorder:
             if not self._recording:
                 return None
             self._recording = False
-            if self._stream is not None:
-                try:
-                    self._stream.stop()
-                    self._stream.close()
-                except Exception as e:
-                    logger.error(f"Error stopping stream: {e}")
-                finally:
-                    self._stream = None
-
-            if self._main_buffer:
-                audio = np.concatenate(self._main_buffer)
+            self._close_stream()
+
+            if len(self._main_buffer):
+                # The arena is replaced on the next start(), so the view stays valid.
+                audio = self._main_buffer.view()
                 logger.info(f"Recording stopped: {len(audio)/SAMPLE_RATE:.2f}s")
                 return audio
-            if self._pre_buffer:
-                audio = np.concatenate(list(self._pre_buffer))
+            if len(self._pre_buffer):
+                audio = self._pre_buffer.to_array()
                 logger.info(
                     f"Recording stopped (pre-buffer): {len(audio)/SAMPLE_RATE:.2f}s"
                 )
@@ -134,18 +154,23 @@ class AudioRecorder:
     def cancel(self) -> None:
         with self._lock:
             self._recording = False
-            if self._stream is not None:
-                try:
-                    self._stream.stop()
-                    self._stream.close()
-                except Exception:
-                    pass
-                finally:
-                    self._stream = None
-            self._main_buffer.clear()
+            self._close_stream()
+            self._main_buffer = AudioArena(0)
             self._pre_buffer.clear()
             logger.info("Recording cancelled")
 
+    def _close_stream(self) -> None:
+        """Stop and close the active stream. Caller must hold the lock."""
+        if self._stream is None:
+            return
+        try:
+            self._stream.stop()
+            self._stream.close()
+        except Exception as e:
+            logger.error(f"Error stopping stream: {e}")
+        finally:
+            self._stream = None
+
     @property
     def is_recording(self) -> bool:
         return self._recording
@@ -2,6 +2,11 @@
 
 from typing import Optional, Callable
 
+try:
+    import sounddevice as sd
+except (ImportError, OSError):  # missing package or PortAudio library
+    sd = None
+
 from ..config import SAMPLE_RATE, CHANNELS
 from ..logging_utils import get_logger
 
@@ -18,14 +23,16 @@ def open_stream_with_fallback(
 
     Returns (stream, used_device) or None.
     """
+    if sd is None:
+        logger.error("Cannot open audio stream: sounddevice is not available")
+        return None
+
     devices_to_try: list[Optional[int]] = [device] if device is not None else [None]
     if device is not None:
         devices_to_try.append(None)
 
     for idx, dev in enumerate(devices_to_try):
         try:
-            import sounddevice as sd
-
             stream = sd.InputStream(
                 samplerate=SAMPLE_RATE,
                 channels=CHANNELS,
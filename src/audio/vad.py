@@ -1,5 +1,7 @@
 """Voice Activity Detection utilities."""
 
+import numpy as np
+
 from ..config import SAMPLE_RATE
 from ..logging_utils import get_logger
 
@@ -9,9 +11,10 @@ logger = get_logger("audio.vad")
 class VADProcessor:
     """Voice Activity Detection using webrtcvad."""
 
-    def __init__(self, aggressiveness: int = 2):
+    def __init__(self, aggressiveness: int = 2, frame_samples: int = 480):
         self._vad = None
         self._aggressiveness = max(0, min(3, aggressiveness))
+        self._allocate_pcm(frame_samples)
         self._init_vad()
 
     def _init_vad(self):
@@ -25,7 +28,28 @@ class VADProcessor:
             logger.warning("webrtcvad not available, VAD disabled")
             self._vad = None
 
-    def is_speech(self, audio_frame: bytes) -> bool:
+    def _allocate_pcm(self, frame_samples: int) -> None:
+        """Allocate scratch buffers reused for every float32 -> int16 conversion."""
+        self._scaled = np.empty(frame_samples, dtype=np.float32)
+        self._pcm = np.empty(frame_samples, dtype=np.int16)
+        # Byte view handed to webrtcvad, which sizes frames from len(buffer) / 2.
+        self._pcm_bytes = self._pcm.data.cast("B")
+
+    def is_speech_frame(self, audio: np.ndarray) -> bool:
+        """Return True if speech is detected in a float32 frame."""
+        if self._vad is None:
+            return True
+
+        if audio.shape[0] != self._pcm.shape[0]:
+            self._allocate_pcm(audio.shape[0])
+        scaled = self._scaled
+        np.multiply(audio, 32767.0, out=scaled)
+        np.rint(scaled, out=scaled)
+        np.clip(scaled, -32768.0, 32767.0, out=scaled)
+        np.copyto(self._pcm, scaled, casting="unsafe")
+        return self.is_speech(self._pcm_bytes)
+
+    def is_speech(self, audio_frame: bytes | memoryview) -> bool:
         """Return True if speech is detected in the frame."""
         if self._vad is None:
             return True
@@ -0,0 +1,111 @@
+"""Clipboard-based text injection: copy the text, then send Ctrl+V."""
+
+import subprocess
+import time
+from typing import Tuple
+
+from .logging_utils import get_logger
+from .system.tools import tool_path, which
+
+logger = get_logger("injector")
+
+
+def paste_with_xclip(text: str) -> bool:
+    """Copy text with xclip and paste it with xdotool's Ctrl+V (X11)."""
+    try:
+        # Save to clipboard using xclip
+        proc = subprocess.Popen(
+            [tool_path("xclip"), "-selection", "clipboard", "-i"], stdin=subprocess.PIPE
+        )
+        proc.communicate(input=text.encode("utf-8"), timeout=2)
+
+        if proc.returncode != 0:
+            logger.error("xclip failed to copy")
+            return False
+
+        _wait_for_clipboard(text)
+
+        # Simulate Ctrl+V using xdotool
+        result = subprocess.run(
+            [tool_path("xdotool"), "key", "--clearmodifiers", "ctrl+v"],
+            capture_output=True,
+            timeout=2,
+        )
+
+        if result.returncode != 0:
+            logger.error(f"xdotool key failed: {result.stderr.decode()}")
+            return False
+
+        return True
+
+    except Exception as e:
+        logger.error(f"xclip injection failed: {e}")
+        return False
+
+
+def _wait_for_clipboard(text: str, timeout: float = 0.15) -> None:
+    """Poll until xclip serves the new clipboard text, up to timeout."""
+    deadline = time.monotonic() + timeout
+    expected = text.encode("utf-8")
+    while time.monotonic() < deadline:
+        try:
+            result = subprocess.run(
+                [tool_path("xclip"), "-selection", "clipboard", "-o"],
+                capture_output=True,
+                timeout=max(0.0, deadline - time.monotonic()),
+            )
+        except subprocess.TimeoutExpired:
+            return
+        if result.stdout == expected:
+            return
+        # Each poll forks xclip; a few per paste is plenty.
+        time.sleep(0.025)
+
+
+def paste_with_wl_copy(text: str) -> bool:
+    """Copy text with wl-copy and paste it with wtype or ydotool (Wayland)."""
+    try:
+        # Copy to clipboard
+        proc = subprocess.Popen([tool_path("wl-copy")], stdin=subprocess.PIPE)
+        proc.communicate(input=text.encode("utf-8"), timeout=2)
+
+        if proc.returncode != 0:
+            return False
+
+        time.sleep(0.05)
+
+        # Try wtype for Ctrl+V, or ydotool
+        if which("wtype"):
+            result = subprocess.run(
+                [tool_path("wtype"), "-M", "ctrl", "v", "-m", "ctrl"],
+                capture_output=True,
+                timeout=2,
+            )
+            return result.returncode == 0
+        elif which("ydotool"):
+            result = subprocess.run(
+                [tool_path("ydotool"), "key", "29:1", "47:1", "47:0", "29:0"],  # Ctrl+V
+                capture_output=True,
+                timeout=2,
+            )
+            return result.returncode == 0
+
+        return False
+
+    except Exception as e:
+        logger.error(f"wl-copy injection failed: {e}")
+        return False
+
+
+def copy_to_clipboard(text: str) -> Tuple[bool, str]:
+    """Last resort: leave the text on the clipboard for the user to paste."""
+    try:
+        import pyperclip
+
+        pyperclip.copy(text)
+        msg = "Text copied to clipboard (Ctrl+V to paste)"
+        logger.info(msg)
+        return True, msg
+    except Exception as e:
+        logger.error(f"Clipboard fallback failed: {e}")
+        return False, f"Failed to copy: {e}"
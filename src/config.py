@@ -1,14 +1,30 @@
 """Configuration management for Whisper GUI Wrapper."""
 
+import atexit
+import functools
 import json
+import math
 import os
-from dataclasses import dataclass, asdict
+import threading
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 # Application constants (single source of truth in meta.py)
 from .meta import APP_NAME
 
+# Allowed values live with the validation tables; re-exported for callers
+from .config_validation import (  # noqa: F401
+    AVAILABLE_MODELS,
+    CHOICES,
+    COMPUTE_TYPES,
+    OVERLAY_THEMES,
+    RANGES,
+    coerce,
+    dumps,
+    loads,
+)
+
 # Paths
 CONFIG_DIR = Path.home() / ".config" / APP_NAME
 CONFIG_FILE = CONFIG_DIR / "config.json"
@@ -23,16 +39,19 @@ SAMPLE_RATE = 16000
 CHANNELS = 1
 PRE_BUFFER_MS = 400
 
-# Available models
-AVAILABLE_MODELS = ["tiny", "base", "small", "medium", "large-v3"]
-
 # Default hotkeys
 DEFAULT_HOTKEY_TOGGLE = "<ctrl>+<alt>+r"
 DEFAULT_HOTKEY_CANCEL = "escape"
-OVERLAY_THEMES = ("auto", "dark", "light")
+
+# Delay before coalesced config updates are written to disk
+SAVE_DEBOUNCE_SEC = 0.5
+
+
+# Directories already created by this process
+_ensured_dirs: set[Path] = set()
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """User settings with defaults."""
 
@@ -42,6 +61,8 @@ class Settings:
     vad_threshold: int = 2  # webrtcvad aggressiveness (0-3)
     model_size: str = "medium"
     device: str = "auto"  # auto/cpu/cuda
+    compute_type: str = "auto"  # see COMPUTE_TYPES
+    streaming_beam_size: int = 1  # live preview decoding (1 = greedy, up to 5)
     language: Optional[str] = None  # None = auto-detect
     hotkey_toggle: str = DEFAULT_HOTKEY_TOGGLE
     hotkey_cancel: str = DEFAULT_HOTKEY_CANCEL
@@ -52,33 +73,52 @@ class Settings:
 
     def validate(self) -> None:
         """Validate and clamp settings to valid ranges."""
-        self.vad_silence_timeout = max(0.5, min(3.0, self.vad_silence_timeout))
-        self.vad_threshold = max(0, min(3, self.vad_threshold))
-        if self.model_size not in AVAILABLE_MODELS:
-            self.model_size = "medium"
-        if self.device not in ("auto", "cpu", "cuda"):
-            self.device = "auto"
+        for name, allowed in CHOICES.items():
+            # Choices are strings; checking the type first also keeps unhashable
+            # JSON values (lists, objects) out of the frozenset lookup.
+            value = getattr(self, name)
+            if not (isinstance(value, str) and value in allowed):
+                setattr(self, name, _FIELD_DEFAULTS[name])
+        for name, (kind, low, high) in RANGES.items():
+            # Clamp as float before converting: int(inf) raises OverflowError.
+            value = coerce(getattr(self, name), float, None)
+            if value is None or math.isnan(value):
+                setattr(self, name, _FIELD_DEFAULTS[name])
+            else:
+                setattr(self, name, kind(min(high, max(low, value))))
         if self.max_recording_sec is not None:
-            self.max_recording_sec = max(5.0, float(self.max_recording_sec))
-        if self.overlay_theme not in OVERLAY_THEMES:
-            self.overlay_theme = "auto"
-        self.overlay_opacity = max(0.1, min(1.0, float(self.overlay_opacity)))
+            limit = coerce(self.max_recording_sec, float, None)
+            # JSON's Infinity/NaN parse as floats; an infinite cap has no sample count.
+            if limit is None or not math.isfinite(limit):
+                self.max_recording_sec = None
+            else:
+                self.max_recording_sec = max(5.0, limit)
         self.auto_paste = bool(self.auto_paste)
 
 
+# Field defaults in declaration order (slots leave Settings without a __dict__)
+_FIELD_DEFAULTS = {f.name: f.default for f in fields(Settings)}
+_FIELD_NAMES = tuple(_FIELD_DEFAULTS)
+
+
 class ConfigManager:
     """Manages loading and saving configuration."""
 
     def __init__(self):
         self._settings: Optional[Settings] = None
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
         self._ensure_dirs()
 
     def _ensure_dirs(self) -> None:
-        """Create necessary directories."""
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        MODELS_DIR.mkdir(parents=True, exist_ok=True)
-        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        """Create necessary directories (once per process for each path)."""
+        # LOG_DIR and MODELS_DIR live inside CONFIG_DIR and CACHE_DIR, so
+        # creating the leaves with parents=True covers all four.
+        for path in (LOG_DIR, MODELS_DIR):
+            if path not in _ensured_dirs:
+                path.mkdir(parents=True, exist_ok=True)
+                _ensured_dirs.add(path)
 
     @property
     def settings(self) -> Settings:
@@ -89,51 +129,94 @@ class ConfigManager:
 
     def load(self) -> Settings:
         """Load settings from config file."""
-        if CONFIG_FILE.exists():
-            try:
-                with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                settings = Settings(
-                    **{
-                        k: v
-                        for k, v in data.items()
-                        if k in Settings.__dataclass_fields__
-                    }
-                )
-                settings.validate()
-                return settings
-            except (json.JSONDecodeError, TypeError):
-                pass
+        try:
+            with open(CONFIG_FILE, "rb") as f:
+                data = loads(f.read())
+            settings = Settings(**{k: v for k, v in data.items() if k in _FIELD_NAMES})
+            settings.validate()
+            return settings
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, UnicodeDecodeError, TypeError):
+            pass
         return Settings()
 
     def save(self, settings: Optional[Settings] = None) -> None:
         """Save settings to config file."""
-        if settings is not None:
-            self._settings = settings
-        if self._settings is not None:
-            self._settings.validate()
-            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(asdict(self._settings), f, indent=2, ensure_ascii=False)
-
-    def update(self, **kwargs) -> None:
-        """Update specific settings."""
-        for key, value in kwargs.items():
-            if hasattr(self.settings, key):
-                setattr(self.settings, key, value)
-        self.save()
+        with self._lock:
+            if settings is not None:
+                self._settings = settings
+            self._cancel_pending_save()
+            if self._settings is not None:
+                self._write(self._settings)
+
+    def update(self, flush: bool = False, **kwargs) -> None:
+        """Update specific settings; the write is debounced unless flush=True."""
+        settings = self.settings
+        with self._lock:
+            for key, value in kwargs.items():
+                if hasattr(settings, key):
+                    setattr(settings, key, value)
+        if flush:
+            self.save()
+            return
+        with self._lock:
+            self._cancel_pending_save()
+            self._dirty = True
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SEC, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write pending updates, if any."""
+        with self._lock:
+            if self._dirty and self._settings is not None:
+                self._cancel_pending_save()
+                self._write(self._settings)
+
+    def _cancel_pending_save(self) -> None:
+        self._dirty = False
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+
+    def _write(self, settings: Settings) -> None:
+        settings.validate()
+        data = dumps(_settings_dict(settings))
+        # Re-saving unchanged settings (e.g. the settings dialog's OK) skips
+        # the write and fsync entirely.
+        try:
+            if CONFIG_FILE.read_bytes() == data:
+                return
+        except OSError:
+            pass
+        tmp = CONFIG_FILE.with_suffix(".json.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, CONFIG_FILE)
+
+
+def _settings_dict(settings: Settings) -> dict[str, Any]:
+    """Flat field mapping; cheaper than asdict(), which deep-copies values."""
+    return {name: getattr(settings, name) for name in _FIELD_NAMES}
 
 
 # Global config instance
 config = ConfigManager()
+# Write any debounced update still pending at exit
+atexit.register(config.flush)
 
 
 def is_wayland() -> bool:
     """Check if running under Wayland."""
-    return os.environ.get("XDG_SESSION_TYPE") == "wayland"
+    return get_display_server() == "wayland"
 
 
+@functools.lru_cache(maxsize=1)
 def get_display_server() -> str:
-    """Get current display server type."""
+    """Get current display server type (cached for the process lifetime)."""
     session_type = os.environ.get("XDG_SESSION_TYPE", "").lower()
     if session_type == "wayland":
         return "wayland"
@@ -145,3 +228,8 @@ def get_display_server() -> str:
     if os.environ.get("DISPLAY"):
         return "x11"
     return "unknown"
+
+
+def invalidate_display_server_cache() -> None:
+    """Forget the cached display server, e.g. after changing the environment."""
+    get_display_server.cache_clear()
@@ -0,0 +1,51 @@
+"""Allowed setting values, validation helpers and config (de)serialization."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+# Available models
+AVAILABLE_MODELS = ["tiny", "base", "small", "medium", "large-v3"]
+OVERLAY_THEMES = ("auto", "dark", "light")
+# "auto" picks int8 on CPU and int8_float16 on CUDA
+COMPUTE_TYPES = ("auto", "int8", "int8_float16", "float16", "float32")
+
+# Enumerated settings: name -> allowed values (others reset to the default)
+CHOICES = {
+    "model_size": frozenset(AVAILABLE_MODELS),
+    "device": frozenset(("auto", "cpu", "cuda")),
+    "compute_type": frozenset(COMPUTE_TYPES),
+    "overlay_theme": frozenset(OVERLAY_THEMES),
+}
+# Numeric settings: name -> (type, low, high); non-numbers reset to the default
+RANGES = {
+    "vad_silence_timeout": (float, 0.5, 3.0),
+    "vad_threshold": (int, 0, 3),
+    "streaming_beam_size": (int, 1, 5),
+    "overlay_opacity": (float, 0.1, 1.0),
+}
+
+
+def coerce(value: Any, kind: type, default: Any) -> Any:
+    """Convert a loaded value to kind, or return default if it cannot be."""
+    try:
+        return kind(value)
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize config data to indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
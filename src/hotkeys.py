@@ -8,6 +8,19 @@ from .logging_utils import get_logger
 
 logger = get_logger("hotkeys")
 
+# Single-key names accepted for the cancel hotkey -> pynput Key attribute
+_SINGLE_KEY_NAMES = {
+    "escape": "esc",
+    "esc": "esc",
+    "space": "space",
+    "enter": "enter",
+    "return": "enter",
+    "tab": "tab",
+    "backspace": "backspace",
+    "delete": "delete",
+    **{f"f{i}": f"f{i}" for i in range(1, 13)},
+}
+
 
 class HotkeyManager:
     """Manages global hotkeys."""
@@ -88,8 +101,10 @@ class HotkeyManager:
                     cancel_key = self._parse_single_key(cancel_hotkey)
                     if cancel_key:
 
+                        # Key members are singletons, so identity is enough and
+                        # skips KeyCode.__eq__ for every keystroke system-wide.
                         def on_press(key):
-                            if key == cancel_key:
+                            if key is cancel_key:
                                 self._on_cancel()
 
                         self._key_listener = keyboard.Listener(on_press=on_press)
@@ -115,30 +130,11 @@ class HotkeyManager:
             if key_str.startswith("<") and key_str.endswith(">"):
                 key_str = key_str[1:-1]
 
-            key_map = {
-                "escape": Key.esc,
-                "esc": Key.esc,
-                "space": Key.space,
-                "enter": Key.enter,
-                "return": Key.enter,
-                "tab": Key.tab,
-                "backspace": Key.backspace,
-                "delete": Key.delete,
-                "f1": Key.f1,
-                "f2": Key.f2,
-                "f3": Key.f3,
-                "f4": Key.f4,
-                "f5": Key.f5,
-                "f6": Key.f6,
-                "f7": Key.f7,
-                "f8": Key.f8,
-                "f9": Key.f9,
-                "f10": Key.f10,
-                "f11": Key.f11,
-                "f12": Key.f12,
-            }
-
-            return key_map.get(key_str)
+            name = _SINGLE_KEY_NAMES.get(key_str)
+            if name is None:
+                logger.warning(f"Unsupported cancel key: '{key_str}'")
+                return None
+            return getattr(Key, name)
 
         except Exception as e:
             logger.error(f"Failed to parse key '{key_str}': {e}")
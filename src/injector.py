@@ -1,13 +1,20 @@
-import shutil
 import subprocess
 import time
 from typing import Optional, Tuple
 
+from .clipboard import copy_to_clipboard, paste_with_wl_copy, paste_with_xclip
 from .config import get_display_server
 from .logging_utils import get_logger
+from .system.tools import tool_path, which
 
 logger = get_logger("injector")
 
+_INJECTION_TOOLS = ("xdotool", "xclip", "wtype", "ydotool", "wl-copy")
+
+# Time for the paste hotkey's modifiers to be released and for focus to leave
+# the overlay before a paste keystroke is synthesised.
+PASTE_FOCUS_DELAY = 0.1
+
 
 class TextInjector:
     def __init__(self):
@@ -18,19 +25,19 @@ class TextInjector:
     def _detect_method(self) -> None:
         # For X11: use xclip + xdotool Ctrl+V (most reliable for Unicode/Cyrillic)
         if self._display_server == "x11":
-            if shutil.which("xclip") and shutil.which("xdotool"):
+            if which("xclip") and which("xdotool"):
                 self._method = "xclip"
                 logger.info("Using xclip + Ctrl+V for text injection (X11, Unicode)")
                 return
 
         # For Wayland
-        if shutil.which("wl-copy") and shutil.which("wtype"):
+        if which("wl-copy") and which("wtype"):
             self._method = "wl-copy"
             logger.info("Using wl-copy + Ctrl+V for text injection (Wayland)")
-        elif shutil.which("wtype"):
+        elif which("wtype"):
             self._method = "wtype"
             logger.info("Using wtype for text injection (Wayland)")
-        elif shutil.which("ydotool"):
+        elif which("ydotool"):
             self._method = "ydotool"
             logger.info("Using ydotool for text injection")
         else:
@@ -40,7 +47,15 @@ class TextInjector:
     def _inject_xdotool(self, text: str) -> bool:
         try:
             result = subprocess.run(
-                ["xdotool", "type", "--clearmodifiers", "--delay", "0", "--", text],
+                [
+                    tool_path("xdotool"),
+                    "type",
+                    "--clearmodifiers",
+                    "--delay",
+                    "0",
+                    "--",
+                    text,
+                ],
                 capture_output=True,
                 timeout=10,
             )
@@ -55,42 +70,10 @@ class TextInjector:
             logger.error(f"xdotool injection failed: {e}")
             return False
 
-    def _inject_xclip(self, text: str) -> bool:
-        try:
-            # Save to clipboard using xclip
-            proc = subprocess.Popen(
-                ["xclip", "-selection", "clipboard", "-i"], stdin=subprocess.PIPE
-            )
-            proc.communicate(input=text.encode("utf-8"), timeout=2)
-
-            if proc.returncode != 0:
-                logger.error("xclip failed to copy")
-                return False
-
-            # Wait for clipboard to be ready
-            time.sleep(0.15)
-
-            # Simulate Ctrl+V using xdotool
-            result = subprocess.run(
-                ["xdotool", "key", "--clearmodifiers", "ctrl+v"],
-                capture_output=True,
-                timeout=2,
-            )
-
-            if result.returncode != 0:
-                logger.error(f"xdotool key failed: {result.stderr.decode()}")
-                return False
-
-            return True
-
-        except Exception as e:
-            logger.error(f"xclip injection failed: {e}")
-            return False
-
     def _inject_wtype(self, text: str) -> bool:
         try:
             result = subprocess.run(
-                ["wtype", "--", text], capture_output=True, timeout=10
+                [tool_path("wtype"), "--", text], capture_output=True, timeout=10
             )
             if result.returncode != 0:
                 logger.error(f"wtype error: {result.stderr.decode()}")
@@ -106,7 +89,9 @@ class TextInjector:
     def _inject_ydotool(self, text: str) -> bool:
         try:
             result = subprocess.run(
-                ["ydotool", "type", "--", text], capture_output=True, timeout=10
+                [tool_path("ydotool"), "type", "--", text],
+                capture_output=True,
+                timeout=10,
             )
             return result.returncode == 0
         except subprocess.TimeoutExpired:
@@ -116,80 +101,41 @@ class TextInjector:
             logger.error(f"ydotool injection failed: {e}")
             return False
 
-    def _inject_wl_copy(self, text: str) -> bool:
-        try:
-            # Copy to clipboard
-            proc = subprocess.Popen(["wl-copy"], stdin=subprocess.PIPE)
-            proc.communicate(input=text.encode("utf-8"), timeout=2)
-
-            if proc.returncode != 0:
-                return False
-
-            time.sleep(0.05)
-
-            # Try wtype for Ctrl+V, or ydotool
-            if shutil.which("wtype"):
-                result = subprocess.run(
-                    ["wtype", "-M", "ctrl", "v", "-m", "ctrl"],
-                    capture_output=True,
-                    timeout=2,
-                )
-                return result.returncode == 0
-            elif shutil.which("ydotool"):
-                result = subprocess.run(
-                    ["ydotool", "key", "29:1", "47:1", "47:0", "29:0"],  # Ctrl+V
-                    capture_output=True,
-                    timeout=2,
-                )
-                return result.returncode == 0
-
-            return False
-
-        except Exception as e:
-            logger.error(f"wl-copy injection failed: {e}")
-            return False
-
-    def _inject_clipboard(self, text: str) -> Tuple[bool, str]:
-        try:
-            import pyperclip
-
-            pyperclip.copy(text)
-            msg = "Text copied to clipboard (Ctrl+V to paste)"
-            logger.info(msg)
-            return True, msg
-        except Exception as e:
-            logger.error(f"Clipboard fallback failed: {e}")
-            return False, f"Failed to copy: {e}"
-
-    def inject(self, text: str) -> Tuple[bool, Optional[str]]:
+    def _inject_with_method(self, text: str) -> bool:
+        if self._method == "xdotool":
+            return self._inject_xdotool(text)
+        if self._method == "xclip":
+            return paste_with_xclip(text)
+        if self._method == "wtype":
+            return self._inject_wtype(text)
+        if self._method == "ydotool":
+            return self._inject_ydotool(text)
+        if self._method == "wl-copy":
+            return paste_with_wl_copy(text)
+        return False
+
+    def inject(
+        self, text: str, focus_delay: float = 0.0
+    ) -> Tuple[bool, Optional[str]]:
         if not text:
             return True, None
 
-        logger.debug(f"Injecting text ({len(text)} chars) via {self._method}")
+        # Auto-paste after transcription needs no delay: the stop hotkey was
+        # released long ago. Callers acting straight from a hotkey or an
+        # overlay click pass focus_delay so the keys and focus can settle.
+        if focus_delay > 0:
+            time.sleep(focus_delay)
+        logger.debug("Injecting text (%d chars) via %s", len(text), self._method)
 
-        # Small delay to ensure window focus
-        time.sleep(0.1)
-
-        success = False
         message = None
-
-        if self._method == "xdotool":
-            success = self._inject_xdotool(text)
-        elif self._method == "xclip":
-            success = self._inject_xclip(text)
-        elif self._method == "wtype":
-            success = self._inject_wtype(text)
-        elif self._method == "ydotool":
-            success = self._inject_ydotool(text)
-        elif self._method == "wl-copy":
-            success = self._inject_wl_copy(text)
+        success = self._inject_with_method(text)
 
         # Fallback to clipboard if injection failed
-        if not success or self._method == "clipboard":
-            success, message = self._inject_clipboard(text)
+        if not success:
+            success, message = copy_to_clipboard(text)
 
         if success and not message:
-            logger.info(f"Text injected successfully ({len(text)} chars)")
+            logger.info("Text injected successfully (%d chars)", len(text))
 
         return success, message
 
@@ -203,18 +149,16 @@ class TextInjector:
 
 
 def check_tools() -> dict:
-    tools = {
-        "xdotool": shutil.which("xdotool") is not None,
-        "xclip": shutil.which("xclip") is not None,
-        "wtype": shutil.which("wtype") is not None,
-        "ydotool": shutil.which("ydotool") is not None,
-        "wl-copy": shutil.which("wl-copy") is not None,
-    }
+    tools = {name: which(name) is not None for name in _INJECTION_TOOLS}
 
     # Check if ydotool daemon is running
     if tools["ydotool"]:
         try:
-            result = subprocess.run(["pgrep", "-x", "ydotoold"], capture_output=True)
+            result = subprocess.run(
+                ["pgrep", "-x", "ydotoold"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
             tools["ydotoold_running"] = result.returncode == 0
         except Exception:
             tools["ydotoold_running"] = False
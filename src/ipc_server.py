@@ -2,7 +2,7 @@
 
 from typing import Callable, Optional
 
-from PyQt6.QtNetwork import QLocalServer
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
 from PyQt6.QtCore import QObject
 
 from .logging_utils import get_logger
@@ -32,15 +32,22 @@ class IpcServer(QObject):
     def _handle_connection(self):
         if not self._server:
             return
-        socket = self._server.nextPendingConnection()
-        if socket:
-            socket.waitForReadyRead(1000)
-            data = socket.readAll().data().decode("utf-8").strip()
-            logger.debug(f"IPC received: {data}")
-            response = self._handler(data)
-            socket.write(response.encode())
-            socket.flush()
-            socket.disconnectFromServer()
+        while (socket := self._server.nextPendingConnection()) is not None:
+            socket.disconnected.connect(socket.deleteLater)
+            socket.readyRead.connect(lambda s=socket: self._handle_ready_read(s))
+            if socket.bytesAvailable():
+                self._handle_ready_read(socket)
+
+    def _handle_ready_read(self, socket: QLocalSocket):
+        # Commands are a single short word sent in one write, so no framing.
+        data = socket.readAll().data().decode("utf-8").strip()
+        if not data:
+            return
+        logger.debug("IPC received: %s", data)
+        response = self._handler(data)
+        socket.write(response.encode())
+        # Closes once the pending response has been written.
+        socket.disconnectFromServer()
 
     def close(self):
         if self._server:
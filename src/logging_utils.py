@@ -15,6 +15,11 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 MAX_LOG_SIZE = 5 * 1024 * 1024  # 5 MB
 BACKUP_COUNT = 3
 
+# LOG_FORMAT never shows thread or process details, so skip collecting them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 
 def setup_logging(debug: bool = False) -> logging.Logger:
     """
@@ -35,10 +40,12 @@ def setup_logging(debug: bool = False) -> logging.Logger:
     # Clear existing handlers
     logger.handlers.clear()
 
+    formatter = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
-    console_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+    console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
 
     # File handler with rotation
@@ -48,7 +55,7 @@ def setup_logging(debug: bool = False) -> logging.Logger:
             log_file, maxBytes=MAX_LOG_SIZE, backupCount=BACKUP_COUNT, encoding="utf-8"
         )
         file_handler.setLevel(log_level)
-        file_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+        file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     except (OSError, PermissionError) as e:
         logger.warning(f"Could not create log file: {e}")
@@ -1,38 +1,63 @@
 """Model cache helpers."""
 
+import os
 import shutil
+import threading
 from pathlib import Path
-from typing import Set, List
+from typing import Set, List, Optional, Tuple
 
 from ..config import MODELS_DIR
 
+# Repo name prefixes stripped to get the size used in AVAILABLE_MODELS
+_REPO_PREFIXES = ("faster-whisper-", "whisper-")
+
+# (models dir, its mtime_ns, [(entry name, entry path)]) from the last scan
+_listing: Optional[Tuple[Path, int, List[Tuple[str, Path]]]] = None
+_listing_lock = threading.Lock()
+
+
+def _list_models_dir() -> List[Tuple[str, Path]]:
+    """Return subdirectories of MODELS_DIR, rescanning only when it changed."""
+    global _listing
+    try:
+        mtime = os.stat(MODELS_DIR).st_mtime_ns
+    except OSError:
+        return []
+    with _listing_lock:
+        if _listing is not None and _listing[:2] == (MODELS_DIR, mtime):
+            return _listing[2]
+        with os.scandir(MODELS_DIR) as it:
+            # DirEntry.is_dir() answers from d_type; only symlinks need a stat.
+            entries = [(e.name, Path(e.path)) for e in it if e.is_dir()]
+        _listing = (MODELS_DIR, mtime, entries)
+        return entries
+
+
+def _invalidate_listing() -> None:
+    global _listing
+    with _listing_lock:
+        _listing = None
+
 
 def _model_dirs(model_name: str) -> List[Path]:
     """Return candidate cache dirs matching model name (direct or HF-style)."""
-    if not MODELS_DIR.exists():
-        return []
-    matches = []
-    for entry in MODELS_DIR.iterdir():
-        if not entry.is_dir():
-            continue
-        name = entry.name
-        if name == model_name or name.endswith(f"-{model_name}") or model_name in name:
-            matches.append(entry)
-    return matches
+    # A substring test already covers exact names and "-<model>" suffixes.
+    return [path for name, path in _list_models_dir() if model_name in name]
+
+
+def _short_model_name(dir_name: str) -> str:
+    """Map an HF cache dir like models--Systran--faster-whisper-large-v3 to large-v3."""
+    if not dir_name.startswith("models--"):
+        return dir_name
+    repo = dir_name.rpartition("--")[2]
+    for prefix in _REPO_PREFIXES:
+        if repo.startswith(prefix):
+            return repo[len(prefix) :]
+    return repo
 
 
 def list_cached_models() -> Set[str]:
-    if not MODELS_DIR.exists():
-        return set()
-    models = set()
-    for entry in MODELS_DIR.iterdir():
-        if entry.is_dir():
-            name = entry.name
-            if name.startswith("models--"):
-                models.add(name.split("-")[-1])
-            else:
-                models.add(name)
-    return models
+    return {_short_model_name(name) for name, _ in _list_models_dir()}
 
 
 def is_model_cached(model_name: str) -> bool:
@@ -44,4 +69,6 @@ def remove_model_cache(model_name: str) -> bool:
     for path in _model_dirs(model_name):
         shutil.rmtree(path, ignore_errors=True)
         removed = True
+    if removed:
+        _invalidate_listing()
     return removed
@@ -1,27 +1,40 @@
 """Device detection for Whisper model execution."""
 
+import functools
+import os
 from typing import Tuple
 
 from ..logging_utils import get_logger
 
 logger = get_logger("transcriber.device")
 
+_NVIDIA_DRIVER_PATHS = ("/dev/nvidia0", "/proc/driver/nvidia/version")
 
+
+def _nvidia_driver_present() -> bool:
+    return any(os.path.exists(path) for path in _NVIDIA_DRIVER_PATHS)
+
+
+@functools.lru_cache(maxsize=4)
 def detect_device(preferred: str) -> Tuple[str, str]:
+    """Pick (device, compute_type); cached since GPUs don't appear at runtime."""
     if preferred == "cpu":
         return "cpu", "int8"
 
-    if preferred in ("auto", "cuda"):
-        try:
-            import torch
-
-            if torch.cuda.is_available():
-                logger.info(f"CUDA via PyTorch: {torch.cuda.get_device_name(0)}")
-                return "cuda", "float16"
-        except ImportError:
-            pass
-        except Exception as e:
-            logger.debug(f"PyTorch CUDA check failed: {e}")
+    # CUDA_VISIBLE_DEVICES="" hides every GPU; no need to import torch to learn that
+    if preferred in ("auto", "cuda") and os.environ.get("CUDA_VISIBLE_DEVICES") != "":
+        # torch is slow to import and cannot find CUDA without the NVIDIA driver
+        if _nvidia_driver_present():
+            try:
+                import torch
+
+                if torch.cuda.is_available():
+                    logger.info(f"CUDA via PyTorch: {torch.cuda.get_device_name(0)}")
+                    return "cuda", "float16"
+            except ImportError:
+                pass
+            except Exception as e:
+                logger.debug(f"PyTorch CUDA check failed: {e}")
 
         try:
             import ctranslate2
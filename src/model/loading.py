@@ -0,0 +1,134 @@
+"""Model construction, input preparation and decoding options for the transcriber."""
+
+import os
+import sys
+from typing import Any, Dict
+
+import numpy as np
+
+from ..config import MODELS_DIR, SAMPLE_RATE, config
+from ..logging_utils import get_logger
+
+logger = get_logger("transcriber")
+
+# Silero VAD costs about as much as decoding on short clips, so live previews
+# skip it below this length. Final passes always keep it: it is what stops
+# Whisper from hallucinating text for a silent recording.
+VAD_FILTER_MIN_SAMPLES = 3 * SAMPLE_RATE
+VAD_PARAMS_CLIP = {"min_silence_duration_ms": 500, "speech_pad_ms": 200}
+VAD_PARAMS_STREAM = {"min_silence_duration_ms": 300, "speech_pad_ms": 100}
+
+FINAL_DECODE_OPTIONS: Dict[str, Any] = {"beam_size": 5}
+# Live preview favours latency; beam_size comes from settings.streaming_beam_size
+PREVIEW_DECODE_OPTIONS: Dict[str, Any] = {
+    "best_of": 1,
+    "temperature": 0.0,
+    "condition_on_previous_text": False,
+    "without_timestamps": True,
+}
+
+
+def decode_options(preview: bool) -> Dict[str, Any]:
+    """Decoding options for a final pass or a live preview."""
+    if not preview:
+        return FINAL_DECODE_OPTIONS
+    return dict(PREVIEW_DECODE_OPTIONS, beam_size=config.settings.streaming_beam_size)
+
+
+def create_model(model_name: str, cached: bool, **kwargs):
+    """Build a WhisperModel, skipping the Hub round-trip when it is cached."""
+    from faster_whisper import WhisperModel
+
+    if cached:
+        try:
+            return WhisperModel(
+                model_name,
+                download_root=str(MODELS_DIR),
+                local_files_only=True,
+                **kwargs,
+            )
+        except FileNotFoundError as e:
+            # Includes huggingface_hub's LocalEntryNotFoundError (partial snapshot).
+            logger.warning("Cached %s is incomplete (%s), re-fetching", model_name, e)
+    return WhisperModel(model_name, download_root=str(MODELS_DIR), **kwargs)
+
+
+def cpu_threads() -> int:
+    """CPUs this process may run on (CTranslate2 defaults to only 4 threads)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 0
+
+
+def release_torch_cuda_cache() -> None:
+    """Return torch's cached CUDA blocks if torch was imported (never import it)."""
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return
+    try:
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+            torch.cuda.ipc_collect()
+    except Exception as e:
+        logger.debug("torch CUDA cache release failed: %s", e)
+
+
+def resolve_compute_type(device: str, detected: str) -> str:
+    """Apply the user's compute_type, defaulting to int8 weights on any device.
+
+    A type the device cannot run (float16 on CPU, int8 on older GPUs) falls
+    back to the detected one instead of failing the load.
+    """
+    requested = config.settings.compute_type
+    if requested != "auto":
+        choice = requested
+    elif device == "cuda":
+        choice = "int8_float16"
+    else:
+        return detected
+    try:
+        import ctranslate2
+
+        supported = ctranslate2.get_supported_compute_types(device)
+    except Exception as e:
+        logger.debug("CTranslate2 compute type check failed: %s", e)
+        return choice
+    if choice not in supported:
+        logger.warning(
+            "compute_type %s is not supported on %s, using %s", choice, device, detected
+        )
+        return detected
+    return choice
+
+
+def warm_up(model) -> None:
+    """Decode half a second of silence so CTranslate2 initializes its kernels."""
+    try:
+        segments, _ = model.transcribe(
+            np.zeros(SAMPLE_RATE // 2, dtype=np.float32),
+            language="en",
+            beam_size=1,
+            without_timestamps=True,
+        )
+        for _ in segments:
+            pass
+    except Exception as e:
+        logger.debug("Model warm-up failed: %s", e)
+
+
+def prepare_audio(audio: np.ndarray) -> np.ndarray:
+    """Return float32 audio peak-normalized to [-1, 1], never mutating the input."""
+    owned = audio.dtype != np.float32
+    if owned:
+        audio = audio.astype(np.float32)
+    if not audio.size:
+        return audio
+    # Two reductions instead of materializing np.abs(audio).
+    max_val = max(float(audio.max()), -float(audio.min()))
+    if max_val > 1.0:
+        # Scale in place when the buffer is our own copy; never touch the caller's.
+        audio = np.multiply(
+            audio, np.float32(1.0 / max_val), out=audio if owned else None
+        )
+    return audio
@@ -9,3 +9,13 @@ class TranscriptionResult:
     language: str
     language_probability: float
     duration: float
+
+    @classmethod
+    def from_info(cls, text: str, info) -> "TranscriptionResult":
+        """Build a result from faster-whisper's TranscriptionInfo."""
+        return cls(
+            text=text,
+            language=info.language,
+            language_probability=info.language_probability,
+            duration=info.duration,
+        )
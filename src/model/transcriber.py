@@ -1,15 +1,28 @@
 """Whisper transcription module with lazy model loading."""
 
+import gc
 import threading
-from typing import Optional, Callable
+from typing import Callable, Optional
 
 import numpy as np
 
-from ..config import MODELS_DIR, config, AVAILABLE_MODELS
+from ..config import SAMPLE_RATE, config, AVAILABLE_MODELS
 from ..logging_utils import get_logger
 from .device_selection import detect_device
 from .models import TranscriptionResult
 from .cache import is_model_cached
+from .loading import (
+    VAD_FILTER_MIN_SAMPLES,
+    VAD_PARAMS_CLIP,
+    VAD_PARAMS_STREAM,
+    cpu_threads,
+    create_model,
+    decode_options,
+    prepare_audio,
+    release_torch_cuda_cache,
+    resolve_compute_type,
+    warm_up,
+)
 
 logger = get_logger("transcriber")
 
@@ -19,6 +32,7 @@ class Transcriber:
         self._model = None
         self._model_name: Optional[str] = None
         self._device: Optional[str] = None
+        self._requested_device: Optional[str] = None  # e.g. "auto"
         self._lock = threading.Lock()
         self._loading = False
 
@@ -34,6 +48,13 @@ class Transcriber:
     def current_device(self) -> Optional[str]:
         return self._device
 
+    def _is_current(self, model_name: str, device: str) -> bool:
+        return (
+            self._model is not None
+            and self._model_name == model_name
+            and device in (self._device, self._requested_device)
+        )
+
     def load_model(
         self,
         model_name: Optional[str] = None,
@@ -41,6 +62,16 @@ class Transcriber:
         progress_callback: Optional[Callable[[str, float], None]] = None,
         force_reload: bool = False,
     ) -> bool:
+        model_name = model_name or config.settings.model_size
+        device = device or config.settings.device
+        report = progress_callback or (lambda status, percent: None)
+
+        # Lock-free fast path: the common call finds the model already resident.
+        if not force_reload and self._is_current(model_name, device):
+            logger.info(f"Model {model_name} already loaded")
+            report("ready", 100)
+            return True
+
         with self._lock:
             if self._loading:
                 logger.warning("Model loading already in progress")
@@ -48,146 +79,126 @@ class Transcriber:
             self._loading = True
 
         try:
-            model_name = model_name or config.settings.model_size
-            device = device or config.settings.device
-            cached = is_model_cached(model_name)
-
             if model_name not in AVAILABLE_MODELS:
                 logger.error(f"Invalid model: {model_name}")
                 return False
 
-            if (
-                not force_reload
-                and self._model is not None
-                and self._model_name == model_name
-                and self._device == device
-            ):
-                logger.info(f"Model {model_name} already loaded")
-                if progress_callback:
-                    progress_callback("ready", 100)
-                return True
+            cached = is_model_cached(model_name)
 
             if force_reload and self._model is not None:
                 self.unload_model()
 
-            def _report(status: str, percent: float):
-                if progress_callback:
-                    progress_callback(status, percent)
-
             actual_device, compute_type = detect_device(device)
+            compute_type = resolve_compute_type(actual_device, compute_type)
 
             try:
-                from faster_whisper import WhisperModel
-
-                _report("loading_cached" if cached else "loading", 10)
-
-                self._model = WhisperModel(
-                    model_name,
-                    device=actual_device,
-                    compute_type=compute_type,
-                    download_root=str(MODELS_DIR),
-                )
-
-                self._model_name = model_name
-                self._device = actual_device
-
-                _report("ready", 100)
-
-                logger.info(f"Model loaded: {model_name} on {self._device}")
-                return True
-
+                report("loading_cached" if cached else "loading", 10)
+                self._install(model_name, actual_device, device, compute_type, cached)
             except Exception as e:
-                if actual_device == "cuda":
-                    logger.warning(f"GPU loading failed: {e}, falling back to CPU")
-                    _report("fallback_cpu", 50)
-                    return self._load_cpu_fallback(model_name, progress_callback)
-                raise
+                if actual_device != "cuda":
+                    raise
+                logger.warning(f"GPU loading failed: {e}, falling back to CPU")
+                report("fallback_cpu", 50)
+                try:
+                    cached = is_model_cached(model_name)
+                    self._install(model_name, "cpu", device, "int8", cached)
+                except Exception as e:
+                    logger.error(f"CPU fallback failed: {e}")
+                    return False
+
+            report("ready", 100)
+            logger.info(f"Model loaded: {model_name} on {self._device}")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
-            if progress_callback:
-                progress_callback("error", 0)
+            report("error", 0)
             return False
 
         finally:
             with self._lock:
                 self._loading = False
 
-    def _load_cpu_fallback(
+    def _install(
         self,
         model_name: str,
-        progress_callback: Optional[Callable[[str, float], None]],
-    ) -> bool:
-        try:
-            from faster_whisper import WhisperModel
-
-            self._model = WhisperModel(
-                model_name,
-                device="cpu",
-                compute_type="int8",
-                download_root=str(MODELS_DIR),
-            )
-            self._model_name = model_name
-            self._device = "cpu"
-
-            if progress_callback:
-                progress_callback("ready", 100)
-
-            logger.info("Model loaded on CPU (fallback)")
-            return True
-        except Exception as e:
-            logger.error(f"CPU fallback failed: {e}")
-            return False
+        device: str,
+        requested: str,
+        compute_type: str,
+        cached: bool,
+    ) -> None:
+        # A cached model needs no Hugging Face Hub round-trip.
+        self._model = create_model(
+            model_name,
+            cached,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads() if device == "cpu" else 0,
+        )
+        self._model_name = model_name
+        self._device = device
+        self._requested_device = requested
+
+    def warm_up(self) -> None:
+        """Pay CTranslate2's first-call setup now rather than on first use."""
+        if self._model is not None:
+            warm_up(self._model)
 
     def unload_model(self) -> None:
         with self._lock:
             if self._model is not None:
-                del self._model
                 self._model = None
                 self._model_name = None
                 self._device = None
+                self._requested_device = None
+                # Drop CTranslate2's buffers now rather than at some later GC pass,
+                # so a model switch doesn't briefly hold two models in (V)RAM.
+                gc.collect()
+                release_torch_cuda_cache()
                 logger.info("Model unloaded")
 
-    def _prepare_audio(self, audio: np.ndarray) -> np.ndarray:
-        if audio.dtype != np.float32:
-            audio = audio.astype(np.float32)
-        max_val = np.abs(audio).max()
-        if max_val > 1.0:
-            audio = audio / max_val
-        return audio
+    def _decode(self, audio: np.ndarray, language: Optional[str], **options):
+        """Start decoding; faster-whisper yields segments lazily."""
+        audio = prepare_audio(audio)
+        logger.debug("Transcribing %.2fs of audio", len(audio) / SAMPLE_RATE)
+        return self._model.transcribe(
+            audio, language=language or config.settings.language, **options
+        )
 
     def transcribe(
-        self, audio: np.ndarray, language: Optional[str] = None
+        self,
+        audio: np.ndarray,
+        language: Optional[str] = None,
+        abort_callback: Optional[Callable[[], bool]] = None,
+        preview: bool = False,
     ) -> Optional[TranscriptionResult]:
+        """Transcribe a clip; preview=True trades accuracy for latency (live text)."""
         if self._model is None:
             logger.error("Model not loaded")
             return None
 
         try:
-            language = language or config.settings.language
-            audio = self._prepare_audio(audio)
-            logger.debug(f"Transcribing {len(audio)/16000:.2f}s of audio")
-
-            segments, info = self._model.transcribe(
+            segments, info = self._decode(
                 audio,
-                language=language,
-                beam_size=5,
-                vad_filter=True,
-                vad_parameters={"min_silence_duration_ms": 500, "speech_pad_ms": 200},
+                language,
+                vad_filter=not preview or len(audio) > VAD_FILTER_MIN_SAMPLES,
+                vad_parameters=VAD_PARAMS_CLIP,
+                **decode_options(preview),
             )
 
-            text_parts = [segment.text.strip() for segment in segments]
-            full_text = " ".join(text_parts).strip()
-
-            result = TranscriptionResult(
-                text=full_text,
-                language=info.language,
-                language_probability=info.language_probability,
-                duration=info.duration,
-            )
+            # Segments are decoded lazily, so checking between them stops work early.
+            text_parts = []
+            for segment in segments:
+                if abort_callback and abort_callback():
+                    logger.debug("Transcription aborted")
+                    return None
+                text = segment.text.strip()
+                if text:
+                    text_parts.append(text)
+            full_text = " ".join(text_parts)
 
             logger.info(f"Transcribed: '{full_text[:50]}...' ({info.language})")
-            return result
+            return TranscriptionResult.from_info(full_text, info)
 
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
@@ -204,18 +215,17 @@ class Transcriber:
             return None
 
         try:
-            language = language or config.settings.language
-            audio = self._prepare_audio(audio)
-            logger.debug(f"Stream transcribing {len(audio)/16000:.2f}s of audio")
-
-            segments, info = self._model.transcribe(
+            segments, info = self._decode(
                 audio,
-                language=language,
+                language,
                 beam_size=5,
                 vad_filter=True,
-                vad_parameters={"min_silence_duration_ms": 300, "speech_pad_ms": 100},
+                vad_parameters=VAD_PARAMS_STREAM,
             )
 
+            # on_partial takes the whole transcript, so each update joins all
+            # segments so far: O(K^2) characters over K segments. K is a few
+            # dozen per recording, far below the decoding cost.
             text_parts = []
             for segment in segments:
                 text = segment.text.strip()
@@ -224,14 +234,7 @@ class Transcriber:
                     if on_partial:
                         on_partial(" ".join(text_parts))
 
-            full_text = " ".join(text_parts).strip()
-
-            return TranscriptionResult(
-                text=full_text,
-                language=info.language,
-                language_probability=info.language_probability,
-                duration=info.duration,
-            )
+            return TranscriptionResult.from_info(" ".join(text_parts), info)
 
         except Exception as e:
             logger.error(f"Stream transcription failed: {e}")
@@ -1,17 +1,24 @@
 """Preload CUDA libs from pip packages to avoid lazy import issues."""
 
-from pathlib import Path
 import ctypes
+import importlib
+import os
+from pathlib import Path
 
+# (pip package, library glob) in load order: cuDNN links against cuBLAS
+_CUDA_LIBS = (
+    ("nvidia.cublas", "libcublas*.so*"),
+    ("nvidia.cudnn", "libcudnn*.so*"),
+)
 
-def preload_cuda_libs():
-    try:
-        import nvidia.cublas
 
-        for base_path in nvidia.cublas.__path__:
-            cublas_lib_path = Path(base_path) / "lib"
-            if cublas_lib_path.exists():
-                for lib in sorted(cublas_lib_path.glob("libcublas*.so*")):
+def _preload_package_libs(package: str, pattern: str) -> None:
+    try:
+        module = importlib.import_module(package)
+        for base_path in module.__path__:
+            lib_path = Path(base_path) / "lib"
+            if lib_path.exists():
+                for lib in sorted(lib_path.glob(pattern)):
                     try:
                         ctypes.CDLL(str(lib), mode=ctypes.RTLD_GLOBAL)
                     except OSError:
@@ -20,17 +27,10 @@ def preload_cuda_libs():
     except (ImportError, TypeError, AttributeError):
         pass
 
-    try:
-        import nvidia.cudnn
 
-        for base_path in nvidia.cudnn.__path__:
-            cudnn_lib_path = Path(base_path) / "lib"
-            if cudnn_lib_path.exists():
-                for lib in sorted(cudnn_lib_path.glob("libcudnn*.so*")):
-                    try:
-                        ctypes.CDLL(str(lib), mode=ctypes.RTLD_GLOBAL)
-                    except OSError:
-                        pass
-                break
-    except (ImportError, TypeError, AttributeError):
-        pass
+def preload_cuda_libs():
+    # Load CUDA kernels on first use instead of all at context creation.
+    os.environ.setdefault("CUDA_MODULE_LOADING", "LAZY")
+    # dlopen serializes on the loader lock, so loading in parallel gains nothing.
+    for package, pattern in _CUDA_LIBS:
+        _preload_package_libs(package, pattern)
@@ -3,25 +3,32 @@
 import fcntl
 import os
 from pathlib import Path
-from typing import Optional, TextIO
+from typing import Optional
 
 
-def acquire_lock(lock_file: Path) -> Optional[TextIO]:
+def acquire_lock(lock_file: Path) -> Optional[int]:
+    # O_CREAT without O_TRUNC, so a failed attempt never wipes the owner's PID.
     try:
-        lock = open(lock_file, "w")
-        fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-        lock.write(str(os.getpid()))
-        lock.flush()
-        return lock
-    except (IOError, OSError):
+        fd = os.open(lock_file, os.O_CREAT | os.O_RDWR, 0o644)
+    except OSError:
+        return None
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        pid = str(os.getpid()).encode()
+        os.pwrite(fd, pid, 0)
+        os.ftruncate(fd, len(pid))
+        return fd
+    except OSError:
+        os.close(fd)
         return None
 
 
-def release_lock(lock: Optional[TextIO], lock_file: Path):
-    if lock:
+def release_lock(lock: Optional[int], lock_file: Path):
+    # The file is left in place: unlinking it would let a starting instance lock
+    # the old inode while another creates a fresh one, and both would run.
+    if lock is not None:
         try:
-            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
-            lock.close()
-            lock_file.unlink(missing_ok=True)
-        except Exception:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+            os.close(lock)
+        except OSError:
             pass
@@ -0,0 +1,16 @@
+"""Lookup of external command-line tools."""
+
+import functools
+import shutil
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=None)
+def which(tool: str) -> Optional[str]:
+    """Resolve a tool on PATH once per process."""
+    return shutil.which(tool)
+
+
+def tool_path(name: str) -> str:
+    """Absolute path of a tool, or its bare name if it was not found."""
+    return which(name) or name
@@ -1,10 +1,14 @@
 """Small UI icon helpers."""
 
+import functools
+
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QIcon, QPainter, QPixmap
 
 
+@functools.lru_cache(maxsize=16)
 def make_record_icon(color: str, size: int = 10) -> QIcon:
+    """Return a filled circle icon; rendered once per (color, size)."""
     pixmap = QPixmap(size, size)
     pixmap.fill(Qt.GlobalColor.transparent)
     painter = QPainter(pixmap)
@@ -1,46 +1,68 @@
 """Overlay manager facade."""
 
+import functools
 import os
 import subprocess
 from typing import Optional
 from .overlay_widget import StatusOverlay
 from .overlay_state import OverlayState
 
+# status -> (message with model name, message without one)
+_DOWNLOAD_MESSAGES = {
+    "downloading": ("Downloading {model}...", "Downloading model..."),
+    "loading_cached": ("Loading cached {model}...", "Loading cached model..."),
+    "fallback_cpu": (
+        "GPU unavailable, loading {model} on CPU...",
+        "GPU unavailable, loading on CPU...",
+    ),
+    "loading": ("Loading {model}...", "Loading model..."),
+}
 
-def _system_prefers_dark() -> bool:
-    """Best-effort detection of dark preference on Linux desktops."""
 
-    def _has_dark(text: str) -> bool:
-        return "dark" in (text or "").lower()
+_GNOME_INTERFACE_SCHEMA = "org.gnome.desktop.interface"
 
-    for env_var in ("GTK_THEME", "GNOME_THEME", "COLOR_SCHEME", "QT_STYLE_OVERRIDE"):
-        if _has_dark(os.environ.get(env_var, "")):
-            return True
 
-    # GNOME/Ubuntu reports color-scheme
+def _gnome_interface_setting(key: str) -> str:
+    """Read a GNOME interface setting in-process via Gio, else via gsettings."""
     try:
-        result = subprocess.run(
-            ["gsettings", "get", "org.gnome.desktop.interface", "color-scheme"],
-            capture_output=True,
-            text=True,
-            timeout=0.5,
-        )
-        if result.returncode == 0 and _has_dark(result.stdout):
-            return True
+        from gi.repository import Gio
+
+        source = Gio.SettingsSchemaSource.get_default()
+        schema = source.lookup(_GNOME_INTERFACE_SCHEMA, True) if source else None
+        # GSettings aborts the process on an unknown schema or key, so check first.
+        if schema is None or not schema.has_key(key):
+            return ""
+        return Gio.Settings.new(_GNOME_INTERFACE_SCHEMA).get_string(key)
     except Exception:
         pass
 
     try:
         result = subprocess.run(
-            ["gsettings", "get", "org.gnome.desktop.interface", "gtk-theme"],
+            ["gsettings", "get", _GNOME_INTERFACE_SCHEMA, key],
             capture_output=True,
             text=True,
             timeout=0.5,
         )
-        if result.returncode == 0 and _has_dark(result.stdout):
-            return True
+        return result.stdout if result.returncode == 0 else ""
     except Exception:
-        pass
+        return ""
+
+
+@functools.lru_cache(maxsize=1)
+def _system_prefers_dark() -> bool:
+    """Best-effort detection of dark preference on Linux desktops (cached)."""
+
+    def _has_dark(text: str) -> bool:
+        return "dark" in (text or "").lower()
+
+    for env_var in ("GTK_THEME", "GNOME_THEME", "COLOR_SCHEME", "QT_STYLE_OVERRIDE"):
+        if _has_dark(os.environ.get(env_var, "")):
+            return True
+
+    # GNOME/Ubuntu reports color-scheme; older setups only name a dark gtk-theme
+    for key in ("color-scheme", "gtk-theme"):
+        if _has_dark(_gnome_interface_setting(key)):
+            return True
 
     return False
 
@@ -128,23 +150,26 @@ class OverlayManager:
         self, progress: float = 0, model: str = "", status: str = "loading"
     ):
         if self._overlay:
-            if status == "downloading":
-                message = f"Downloading {model}..." if model else "Downloading model..."
-            elif status == "loading_cached":
-                message = (
-                    f"Loading cached {model}..." if model else "Loading cached model..."
-                )
-            elif status == "fallback_cpu":
-                message = (
-                    f"GPU unavailable, loading {model} on CPU..."
-                    if model
-                    else "GPU unavailable, loading on CPU..."
-                )
-            else:
-                message = f"Loading {model}..." if model else "Loading model..."
+            with_model, without_model = _DOWNLOAD_MESSAGES.get(
+                status, _DOWNLOAD_MESSAGES["loading"]
+            )
+            message = with_model.format(model=model) if model else without_model
             self._overlay.set_state(OverlayState.DOWNLOADING, message=message)
             self._overlay.set_progress(progress)
 
+    def update_downloading(
+        self,
+        progress: float = 0,
+        model: str = "",
+        status: str = "loading",
+        detail: Optional[str] = None,
+    ):
+        """Update loading progress and status detail in a single overlay pass."""
+        if self._overlay:
+            if detail is not None:
+                self._overlay.set_status_detail(detail)
+            self.show_downloading(progress, model, status=status)
+
     def show_error(self, message: str):
         if self._overlay:
             self._overlay.show_temporary(OverlayState.ERROR, message, 3000)
@@ -25,17 +25,18 @@ def setup_overlay_ui(widget: QWidget) -> dict:
 
     label = QLabel()
     label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    label.setObjectName("overlayLabel")
     label.setFont(QFont("Sans", 11, QFont.Weight.Bold))
-    label.setStyleSheet("color: white;")
     label.setWordWrap(True)
     layout.addWidget(label)
 
     status_detail = QLabel()
     status_detail.setAlignment(Qt.AlignmentFlag.AlignCenter)
-    status_detail.setStyleSheet("color: rgba(255, 255, 255, 200);")
+    status_detail.setObjectName("overlayDetail")
     layout.addWidget(status_detail)
 
     text_view = QTextEdit()
+    text_view.setObjectName("overlayText")
     text_view.setReadOnly(False)
     text_view.setMinimumHeight(140)
     text_view.setMaximumHeight(300)
@@ -43,6 +44,7 @@ def setup_overlay_ui(widget: QWidget) -> dict:
     layout.addWidget(text_view)
 
     progress_bar = QProgressBar()
+    progress_bar.setObjectName("overlayProgress")
     progress_bar.setRange(0, 100)
     progress_bar.setTextVisible(False)
     progress_bar.setFixedHeight(8)
@@ -50,6 +52,7 @@ def setup_overlay_ui(widget: QWidget) -> dict:
     layout.addWidget(progress_bar)
 
     level_bar = QProgressBar()
+    level_bar.setObjectName("overlayLevel")
     level_bar.setRange(0, 100)
     level_bar.setTextVisible(False)
     level_bar.setFixedHeight(4)
@@ -57,6 +60,7 @@ def setup_overlay_ui(widget: QWidget) -> dict:
     layout.addWidget(level_bar)
 
     stats_label = QLabel()
+    stats_label.setObjectName("overlayStats")
     stats_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
     layout.addWidget(stats_label)
 
@@ -65,6 +69,8 @@ def setup_overlay_ui(widget: QWidget) -> dict:
     copy_btn = _make_action_button("Copy")
     paste_btn = _make_action_button("Paste")
     hide_btn = _make_action_button("Hide")
+    for btn in (copy_btn, paste_btn, hide_btn):
+        btn.setObjectName("overlayAction")
     actions.addStretch()
     actions.addWidget(record_btn)
     actions.addWidget(copy_btn)
@@ -72,6 +78,7 @@ def setup_overlay_ui(widget: QWidget) -> dict:
     actions.addWidget(hide_btn)
 
     auto_paste_box = QCheckBox("Auto paste")
+    auto_paste_box.setObjectName("overlayAutoPaste")
     auto_paste_box.setChecked(True)
     actions.addWidget(auto_paste_box)
     actions.addStretch()
@@ -0,0 +1,139 @@
+"""Deferred overlay updates: coalesce bursts and apply them on the event loop."""
+
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtGui import QTextCursor
+
+# Progress, detail labels and caption resizes apply once per frame (~30 fps)
+FLUSH_INTERVAL_MS = 33
+
+
+class OverlayUpdates(QObject):
+    """Owns the overlay's timers and the values buffered between flushes."""
+
+    def __init__(
+        self,
+        widgets: dict,
+        apply_state: Callable[[], None],
+        revert: Callable[[], None],
+        resize: Callable[[], None],
+        parent: QObject,
+    ):
+        super().__init__(parent)
+        self._progress_bar = widgets["progress_bar"]
+        self._status_detail = widgets["status_detail"]
+        self._stats_label = widgets["stats_label"]
+        self._text_view = widgets["text_view"]
+        self._resize = resize
+        self._progress_val = 0  # last value set on the bar
+        self._pending_progress: Optional[float] = None
+        self._pending_detail: Optional[str] = None
+        self._pending_stats: Optional[str] = None
+        self._needs_resize = False
+        self._caption = ""
+        self._caption_revision = -1  # document revision after our last write
+        self._caption_lines = 0
+        self._flush_timer = self._single_shot(self._flush, FLUSH_INTERVAL_MS)
+        # A burst of state transitions is applied (and painted) once.
+        self._state_timer = self._single_shot(apply_state, 0)
+        # One revert timer: a new temporary status replaces the pending revert.
+        self._revert_timer = self._single_shot(revert, 0)
+
+    def _single_shot(self, slot: Callable[[], None], interval_ms: int) -> QTimer:
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(interval_ms)
+        timer.timeout.connect(slot)
+        return timer
+
+    def queue_state(self):
+        self._revert_timer.stop()
+        self._state_timer.start()
+
+    def revert_after(self, duration_ms: int):
+        self._revert_timer.start(duration_ms)
+
+    def set_progress(self, progress: float):
+        self._pending_progress = progress
+        self.schedule_flush()
+
+    def set_detail(self, detail: str):
+        self._pending_detail = detail
+        self.schedule_flush()
+
+    def set_stats(self, stats: str):
+        self._pending_stats = stats
+        self.schedule_flush()
+
+    def set_text(self, text: str):
+        view, shown = self._text_view, self._caption
+        # Partial captions grow at the end; append just the new tail unless the
+        # user edited the (editable) view since our last write.
+        if (
+            shown
+            and text.startswith(shown)
+            and view.document().revision() == self._caption_revision
+        ):
+            view.moveCursor(QTextCursor.MoveOperation.End)
+            view.insertPlainText(text[len(shown) :])
+        else:
+            view.setPlainText(text)
+            view.moveCursor(QTextCursor.MoveOperation.End)
+        view.ensureCursorVisible()
+        self._caption = text
+        self._caption_revision = view.document().revision()
+        # Streaming captions mostly extend the last paragraph; only rerun the
+        # layout pass when the paragraph count changes.
+        lines = text.count("\n") + 1
+        if lines != self._caption_lines:
+            self._caption_lines = lines
+            # Captions arrive in clusters; resize once on the next flush.
+            self.request_resize()
+
+    def request_resize(self):
+        self._needs_resize = True
+        self.schedule_flush()
+
+    def schedule_flush(self):
+        # Started on demand, so an idle overlay has no timer wakeups.
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def stop_flush(self):
+        self._flush_timer.stop()
+
+    def stop(self):
+        self._state_timer.stop()
+        self._flush_timer.stop()
+
+    def _flush(self):
+        """Apply the latest buffered values; bursts between ticks collapse."""
+        if self._pending_progress is not None:
+            progress, self._pending_progress = self._pending_progress, None
+            val = 0 if progress <= 0 else (100 if progress >= 100 else int(progress))
+            if val != self._progress_val:
+                self._progress_val = val
+                self._progress_bar.setValue(val)
+        if self._needs_resize:
+            self._needs_resize = False
+            self._resize()
+        if self._pending_detail is not None:
+            detail, self._pending_detail = self._pending_detail, None
+            if detail != self._status_detail.text():
+                self._status_detail.setText(detail)
+        if self._pending_stats is not None:
+            stats, self._pending_stats = self._pending_stats, None
+            if stats != self._stats_label.text():
+                self._stats_label.setText(stats)
+
+
+@contextmanager
+def batch_updates(widget):
+    """Hold back paints while several children change; re-enabling repaints once."""
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
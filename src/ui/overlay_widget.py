@@ -1,26 +1,33 @@
 """Overlay widget showing status and progress."""
 
+from functools import partial
 from typing import Optional, Callable
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QPainter, QBrush
 from PyQt6.QtWidgets import QWidget, QApplication
 from ..logging_utils import get_logger
 from .icons import make_record_icon
-from .themes import get_overlay_palette
+from .themes import (
+    get_overlay_palette,
+    get_overlay_stylesheet,
+    get_record_button_style,
+)
 from .overlay_state import OverlayState, STATE_LABELS
 from .overlay_ui import setup_overlay_ui
+from .overlay_updates import OverlayUpdates, batch_updates
 
 logger = get_logger("ui.overlay")
 
 
 class StatusOverlay(QWidget):
+    # Emitted only on real transitions; GUI-thread receivers can connect with
+    # Qt.ConnectionType.DirectConnection.
     state_changed = pyqtSignal(OverlayState)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._state = OverlayState.HIDDEN
-        self._progress: float = 0
-        self._audio_level: float = 0
+        self._last_message = ""
         self._opacity: float = 0.7
         self._on_copy: Optional[Callable[[], None]] = None
         self._on_paste: Optional[Callable[[], None]] = None
@@ -28,8 +35,10 @@ class StatusOverlay(QWidget):
         self._on_auto_paste_change: Optional[Callable[[bool], None]] = None
         self._on_toggle: Optional[Callable[[], None]] = None
         self._is_recording: bool = False
-        self._drag_pos = None
+        self._record_styled: Optional[bool] = None  # state the button shows
+        self._drag_pos: Optional[tuple] = None  # press offset from top-left
         self._user_positioned = False
+        self._level_val = 0  # last value set on the level bar
         self._setup_ui()
         self.set_theme("dark")
         self._setup_window()
@@ -44,35 +53,55 @@ class StatusOverlay(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
         self.setWindowOpacity(self._opacity)
+        # Querying the screen can be a window-system round trip; cache its
+        # available geometry and refresh it only when Qt reports a change.
+        self._screen_geo = None
+        QApplication.instance().primaryScreenChanged.connect(self._watch_screen)
+        self._watch_screen(QApplication.primaryScreen())
         self._reposition()
 
+    def _watch_screen(self, screen):
+        if screen:
+            screen.availableGeometryChanged.connect(self._refresh_screen_geometry)
+        self._refresh_screen_geometry()
+
+    def _refresh_screen_geometry(self):
+        screen = QApplication.primaryScreen()
+        self._screen_geo = screen.availableGeometry() if screen else None
+
     def _setup_ui(self):
         widgets = setup_overlay_ui(self)
         self._label = widgets["label"]
-        self._status_detail = widgets["status_detail"]
         self._text_view = widgets["text_view"]
         self._progress_bar = widgets["progress_bar"]
         self._level_bar = widgets["level_bar"]
-        self._stats_label = widgets["stats_label"]
         self._record_btn = widgets["record_btn"]
-        self._copy_btn = widgets["copy_btn"]
-        self._paste_btn = widgets["paste_btn"]
-        self._hide_btn = widgets["hide_btn"]
         self._auto_paste_box = widgets["auto_paste_box"]
-
-        self._record_btn.clicked.connect(lambda: self._on_toggle and self._on_toggle())
-        self._copy_btn.clicked.connect(lambda: self._on_copy and self._on_copy())
-        self._paste_btn.clicked.connect(lambda: self._on_paste and self._on_paste())
-        self._hide_btn.clicked.connect(lambda: self._on_hide and self._on_hide())
-        self._auto_paste_box.stateChanged.connect(
-            lambda s: self._on_auto_paste_change
-            and self._on_auto_paste_change(s == Qt.CheckState.Checked)
+        self._updates = OverlayUpdates(
+            widgets, self._apply_state, self._revert_to_idle, self._fit_content, self
         )
 
+        for button, action in (
+            ("record_btn", "toggle"),
+            ("copy_btn", "copy"),
+            ("paste_btn", "paste"),
+            ("hide_btn", "hide"),
+        ):
+            widgets[button].clicked.connect(partial(self._run_action, action))
+        self._auto_paste_box.stateChanged.connect(self._on_auto_paste_state)
+
+    def _run_action(self, action: str):
+        callback = getattr(self, f"_on_{action}")
+        if callback:
+            callback()
+
+    def _on_auto_paste_state(self, state: int):
+        if self._on_auto_paste_change:
+            self._on_auto_paste_change(state == Qt.CheckState.Checked.value)
+
     def _reposition(self):
-        screen = QApplication.primaryScreen()
-        if screen:
-            geo = screen.availableGeometry()
+        geo = self._screen_geo
+        if geo is not None:
             self.move(
                 geo.right() - self.width() - 20, geo.bottom() - self.height() - 20
             )
@@ -80,7 +109,7 @@ class StatusOverlay(QWidget):
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QBrush(self._bg_color))
+        painter.setBrush(self._bg_brush)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(self.rect(), 12, 12)
 
@@ -89,50 +118,56 @@ class StatusOverlay(QWidget):
             theme = "dark"
         c = get_overlay_palette(theme)
         self._colors, self._bg_color = c, c["bg"]
-        self._label.setStyleSheet(f"color: {c['text']};")
-        self._status_detail.setStyleSheet(f"color: {c['muted']}; font-size: 11px;")
-        self._text_view.setStyleSheet(
-            f"QTextEdit {{ background: transparent; color: {c['text']}; border: none; }}"
-        )
-        self._progress_bar.setStyleSheet(
-            f"QProgressBar{{background-color:{c['bar_bg']};border-radius:4px;}}"
-            f"QProgressBar::chunk{{background-color:{c['accent']};border-radius:4px;}}"
-        )
-        self._level_bar.setStyleSheet(
-            f"QProgressBar{{background-color:{c['level_bg']};border-radius:2px;}}"
-            f"QProgressBar::chunk{{background-color:{c['accent']};border-radius:2px;}}"
-        )
-        self._stats_label.setStyleSheet(f"color: {c['muted']}; font-size: 10px;")
-        btn_style = (
-            f"QPushButton{{color:{c['text']};background:transparent;border:1px solid {c['bar_bg']};"
-            f"border-radius:6px;padding:4px 10px;}}QPushButton:hover{{background:{c['bar_bg']};}}"
-        )
-        for btn in (self._copy_btn, self._paste_btn, self._hide_btn):
-            btn.setStyleSheet(btn_style)
-        self._auto_paste_box.setStyleSheet(f"color:{c['text']};")
-        self.set_recording_state(self._is_recording)
-        self.update()
+        self._bg_brush = QBrush(self._bg_color)
+        with batch_updates(self):
+            # One root stylesheet: a single re-polish instead of one per child.
+            self.setStyleSheet(get_overlay_stylesheet(theme))
+            self.set_recording_state(self._is_recording)
 
     def set_state(self, state: OverlayState, message: Optional[str] = None):
+        new_message = message or STATE_LABELS.get(state, "")
+        if state == self._state and new_message == self._last_message:
+            return
+        changed = state != self._state
         self._state = state
-        self._label.setText(message or STATE_LABELS.get(state, ""))
-        self._progress_bar.setVisible(state == OverlayState.DOWNLOADING)
-        self._level_bar.setVisible(state == OverlayState.RECORDING)
-        self._text_view.setVisible(True)
+        self._last_message = new_message
+        # Callers read .state right away; the widget work waits for the event loop.
+        self._updates.queue_state()
+        # Message-only updates (e.g. download progress text) don't re-emit.
+        if changed:
+            self.state_changed.emit(state)
+
+    def _apply_state(self):
+        state = self._state
+        with batch_updates(self):
+            self._label.setText(self._last_message)
+            self._progress_bar.setVisible(state == OverlayState.DOWNLOADING)
+            self._level_bar.setVisible(state == OverlayState.RECORDING)
+            self._text_view.setVisible(True)
         if state == OverlayState.HIDDEN:
+            self._updates.stop_flush()
             self.hide()
         else:
             self.show()
+            self._updates.schedule_flush()  # apply anything buffered while hidden
             if not self._user_positioned:
                 self._reposition()
-        self.update()
-        self.state_changed.emit(state)
 
     def set_progress(self, progress: float):
-        self._progress_bar.setValue(int(max(0, min(100, progress))))
+        self._updates.set_progress(progress)
 
     def set_audio_level(self, level: float):
-        self._level_bar.setValue(min(100, int(max(0, min(1, level)) * 500)))
+        # Already paced by the recorder; skip values that land on the same step.
+        # Speech peaks rarely exceed 0.2, so that maps to a full bar.
+        val = 0 if level <= 0 else (100 if level >= 0.2 else int(level * 500))
+        if val != self._level_val:
+            self._level_val = val
+            self._level_bar.setValue(val)
+
+    def _fit_content(self):
+        self.adjustSize()
+        if not self._user_positioned:
+            self._reposition()
 
     def show_temporary(
         self,
@@ -141,16 +176,13 @@ class StatusOverlay(QWidget):
         duration_ms: int = 2000,
     ):
         self.set_state(state, message)
-        QTimer.singleShot(duration_ms, lambda: self.set_state(OverlayState.IDLE))
+        self._updates.revert_after(duration_ms)
+
+    def _revert_to_idle(self):
+        self.set_state(OverlayState.IDLE)
 
     def set_text(self, text: str):
-        self._text_view.setPlainText(text)
-        self._text_view.verticalScrollBar().setValue(
-            self._text_view.verticalScrollBar().maximum()
-        )
-        self.adjustSize()
-        if not self._user_positioned:
-            self._reposition()
+        self._updates.set_text(text)
 
     def set_hints(self, hints: str):
         pass
@@ -160,10 +192,10 @@ class StatusOverlay(QWidget):
         self.setWindowOpacity(self._opacity)
 
     def set_status_detail(self, detail: str):
-        self._status_detail.setText(detail)
+        self._updates.set_detail(detail)
 
     def set_stats(self, stats: str):
-        self._stats_label.setText(stats)
+        self._updates.set_stats(stats)
 
     def set_actions(
         self,
@@ -183,27 +215,25 @@ class StatusOverlay(QWidget):
 
     def set_recording_state(self, recording: bool):
         self._is_recording = recording
+        if recording == self._record_styled:
+            return
+        self._record_styled = recording
         self._record_btn.setText("Stop" if recording else "Record")
-        base = "#b71c1c" if recording else "#e53935"
-        style = (
-            f"QPushButton{{color:{'#fff' if recording else base};background:{base if recording else 'rgba(229,57,53,0.12)'};"
-            f"border:1px solid {base};border-radius:6px;padding:6px 14px;font-weight:600;}}"
-            f"QPushButton:hover{{background:{'#c62828' if recording else '#e53935'};color:#fff;}}"
-        )
+        style, base = get_record_button_style(recording)
         self._record_btn.setStyleSheet(style)
         self._record_btn.setIcon(make_record_icon(base))
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            self._drag_pos = (
-                event.globalPosition().toPoint() - self.frameGeometry().topLeft()
-            )
+            gp = event.globalPosition()
+            self._drag_pos = (int(gp.x()) - self.x(), int(gp.y()) - self.y())
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
         if event.buttons() & Qt.MouseButton.LeftButton and self._drag_pos:
             self._user_positioned = True
-            self.move(event.globalPosition().toPoint() - self._drag_pos)
+            gp, (dx, dy) = event.globalPosition(), self._drag_pos
+            self.move(int(gp.x()) - dx, int(gp.y()) - dy)
         super().mouseMoveEvent(event)
 
     def resizeEvent(self, event):
@@ -212,6 +242,7 @@ class StatusOverlay(QWidget):
 
     def hide_overlay(self):
         self._state = OverlayState.HIDDEN
+        self._updates.stop()
         self.hide()
 
     @property
@@ -1,8 +1,7 @@
 """Settings dialog for Whisper GUI Wrapper."""
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
-    QApplication,
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
@@ -14,18 +13,61 @@ from PyQt6.QtWidgets import (
 from ..config import config
 from ..model import is_model_cached, remove_model_cache, transcriber
 from ..logging_utils import get_logger
-from .settings_groups import build_hotkey_group, build_audio_group, build_model_group
+from .settings_groups import (
+    build_audio_group,
+    build_hotkey_group,
+    build_model_group,
+    fill_microphone_combo,
+)
 
 logger = get_logger("settings")
 
 
+class _ModelDownloadThread(QThread):
+    """Runs a forced model (re)load off the UI thread."""
+
+    progress_signal = pyqtSignal(str, float)
+    finished_signal = pyqtSignal(bool)
+
+    def __init__(self, model_name: str, parent=None):
+        super().__init__(parent)
+        self.model_name = model_name
+
+    def run(self):
+        last = None
+
+        def report(status: str, percent: float):
+            # Hub downloads report per chunk; forward only visible changes.
+            nonlocal last
+            if (status, int(percent)) != last:
+                last = (status, int(percent))
+                self.progress_signal.emit(status, percent)
+
+        success = transcriber.load_model(
+            model_name=self.model_name, progress_callback=report, force_reload=True
+        )
+        self.finished_signal.emit(bool(success))
+
+
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Whisper Wrapper Settings")
         self.setMinimumWidth(400)
+        self._combo_indexes: dict = {}
+        self._cache_status_map: dict = {}  # model -> cached, for this open
         self._setup_ui()
-        self._load_settings()
+
+    def showEvent(self, event):
+        # The dialog is reused, so reload on every open to pick up tray changes.
+        if not event.spontaneous():
+            fill_microphone_combo(self._microphone)
+            self._combo_indexes.pop((self._microphone, Qt.ItemDataRole.UserRole), None)
+            self._load_settings()
+            self._cache_status_map.clear()
+            # Probe the model cache after the dialog has painted.
+            QTimer.singleShot(0, self._update_cache_status)
+        super().showEvent(event)
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -78,24 +120,34 @@ class SettingsDialog(QDialog):
         self._vad_enabled.setChecked(s.vad_enabled)
         self._vad_timeout.setValue(int(s.vad_silence_timeout * 10))
         self._set_combo_by_data(self._vad_threshold, s.vad_threshold)
+        self._model.blockSignals(True)  # cache status is refreshed after show
         self._set_combo_by_text(self._model, s.model_size)
+        self._model.blockSignals(False)
         self._set_combo_by_data(self._device, s.device)
         self._set_combo_by_data(self._language, s.language)
         self._auto_paste.setChecked(s.auto_paste)
         self._set_combo_by_data(self._overlay_theme, s.overlay_theme)
         self._overlay_opacity.setValue(int(s.overlay_opacity * 100))
         self._overlay_opacity_label.setText(f"{int(s.overlay_opacity * 100)}%")
-        self._update_cache_status()
 
-    def _set_combo_by_data(self, combo, value):
-        idx = combo.findData(value)
+    def _set_combo_by_data(self, combo, value, role=Qt.ItemDataRole.UserRole):
+        idx = self._combo_index(combo, role).get(value, -1)
         if idx >= 0:
             combo.setCurrentIndex(idx)
 
     def _set_combo_by_text(self, combo, value):
-        idx = combo.findText(value)
-        if idx >= 0:
-            combo.setCurrentIndex(idx)
+        self._set_combo_by_data(combo, value, Qt.ItemDataRole.DisplayRole)
+
+    def _combo_index(self, combo, role) -> dict:
+        """value -> row map, built once per combo (microphones reset on each open)."""
+        key = (combo, role)
+        index = self._combo_indexes.get(key)
+        if index is None:
+            index = {}
+            for i in range(combo.count()):
+                index.setdefault(combo.itemData(i, role), i)
+            self._combo_indexes[key] = index
+        return index
 
     def _save_settings(self):
         try:
@@ -126,13 +178,16 @@ class SettingsDialog(QDialog):
 
     def _update_cache_status(self):
         model = self._model.currentText()
-        cached = is_model_cached(model)
+        cached = self._cache_status_map.get(model)
+        if cached is None:
+            cached = self._cache_status_map[model] = is_model_cached(model)
         self._cache_status.setText("Cached" if cached else "Not cached")
         self._clear_cache_btn.setEnabled(cached)
 
     def _download_selected_model(self):
         model = self._model.currentText()
-        progress = QProgressDialog(f"Downloading {model}...", "Cancel", 0, 100, self)
+        # The load can't be interrupted, so offer no Cancel button.
+        progress = QProgressDialog(f"Downloading {model}...", None, 0, 100, self)
         progress.setWindowModality(Qt.WindowModality.ApplicationModal)
         progress.setMinimumDuration(0)
         progress.setValue(0)
@@ -141,23 +196,31 @@ class SettingsDialog(QDialog):
         def on_progress(status: str, percent: float):
             progress.setLabelText(f"{status.capitalize()} {model}...")
             progress.setValue(int(percent))
-            QApplication.processEvents()
 
-        success = transcriber.load_model(
-            model_name=model, progress_callback=on_progress, force_reload=True
-        )
-        progress.close()
-        if success:
-            self._update_cache_status()
-            QMessageBox.information(self, "Model", f"{model} ready (cached)")
-        else:
-            QMessageBox.critical(self, "Model", f"Failed to download {model}")
+        def on_finished(success: bool):
+            progress.close()
+            self._download_model_btn.setEnabled(True)
+            if success:
+                self._cache_status_map.pop(model, None)
+                self._update_cache_status()
+                QMessageBox.information(self, "Model", f"{model} ready (cached)")
+            else:
+                QMessageBox.critical(self, "Model", f"Failed to download {model}")
+
+        # Signals from the worker are queued onto this thread's event loop.
+        worker = _ModelDownloadThread(model, self)
+        worker.progress_signal.connect(on_progress)
+        worker.finished_signal.connect(on_finished)
+        worker.finished.connect(worker.deleteLater)
+        self._download_model_btn.setEnabled(False)
+        worker.start()
 
     def _clear_selected_cache(self):
         model = self._model.currentText()
         if remove_model_cache(model):
             if transcriber.current_model == model:
                 transcriber.unload_model()
+            self._cache_status_map.pop(model, None)
             self._update_cache_status()
             QMessageBox.information(self, "Model Cache", f"Cache for {model} removed")
         else:
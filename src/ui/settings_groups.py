@@ -1,6 +1,7 @@
 """UI group builders for settings dialog."""
 
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
 from PyQt6.QtWidgets import (
     QFormLayout,
     QLabel,
@@ -16,7 +17,7 @@ from PyQt6.QtWidgets import (
 from ..config import AVAILABLE_MODELS, get_display_server, OVERLAY_THEMES
 from ..audio import list_devices
 
-LANGUAGES = [
+LANGUAGES = (
     ("en", "English"),
     ("ru", "Russian"),
     ("de", "German"),
@@ -29,7 +30,39 @@ LANGUAGES = [
     ("ja", "Japanese"),
     ("ko", "Korean"),
     ("zh", "Chinese"),
-]
+)
+
+# (label, data) rows for the language combo, assembled once at import
+_LANGUAGE_ITEMS = (("Auto-detect", None),) + tuple(
+    (name, code) for code, name in LANGUAGES
+)
+
+
+def _make_combo() -> QComboBox:
+    combo = QComboBox()
+    # Size from a fixed character count instead of measuring every item.
+    combo.setSizeAdjustPolicy(
+        QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+    )
+    combo.setMinimumContentsLength(20)
+    return combo
+
+
+def _fill_combo(combo: QComboBox, items) -> None:
+    """Populate (label, data) pairs through one model instead of per-item addItem."""
+    model = QStandardItemModel(combo)
+    for label, data in items:
+        item = QStandardItem(label)
+        item.setData(data, Qt.ItemDataRole.UserRole)
+        model.appendRow(item)
+    combo.setModel(model)
+
+
+def fill_microphone_combo(combo: QComboBox) -> None:
+    """List the current input devices; re-run on each open to catch new mics."""
+    _fill_combo(
+        combo, [("Default", None)] + [(d["name"], d["name"]) for d in list_devices()]
+    )
 
 
 def build_hotkey_group():
@@ -60,10 +93,7 @@ def build_audio_group():
     group = QGroupBox("Audio")
     layout = QFormLayout(group)
 
-    microphone = QComboBox()
-    microphone.addItem("Default", None)
-    for dev in list_devices():
-        microphone.addItem(dev["name"], dev["name"])
+    microphone = _make_combo()  # filled by fill_microphone_combo on each open
     layout.addRow("Microphone:", microphone)
 
     vad_enabled = QCheckBox("Enable Voice Activity Detection")
@@ -82,10 +112,11 @@ def build_audio_group():
     timeout_layout.addWidget(vad_timeout_label)
     layout.addRow("Silence Timeout:", timeout_layout)
 
-    vad_threshold = QComboBox()
-    vad_threshold.addItem("Low (more sensitive)", 1)
-    vad_threshold.addItem("Medium", 2)
-    vad_threshold.addItem("High (less sensitive)", 3)
+    vad_threshold = _make_combo()
+    _fill_combo(
+        vad_threshold,
+        [("Low (more sensitive)", 1), ("Medium", 2), ("High (less sensitive)", 3)],
+    )
     layout.addRow("VAD Sensitivity:", vad_threshold)
 
     return group, {
@@ -102,29 +133,30 @@ def build_model_group():
     group = QGroupBox("Transcription")
     layout = QFormLayout(group)
 
-    model = QComboBox()
-    for m in AVAILABLE_MODELS:
-        model.addItem(m)
+    model = _make_combo()
+    model.addItems(AVAILABLE_MODELS)
     layout.addRow("Model:", model)
 
-    device = QComboBox()
-    device.addItem("Auto (GPU if available)", "auto")
-    device.addItem("CPU only", "cpu")
-    device.addItem("GPU (CUDA)", "cuda")
+    device = _make_combo()
+    _fill_combo(
+        device,
+        [
+            ("Auto (GPU if available)", "auto"),
+            ("CPU only", "cpu"),
+            ("GPU (CUDA)", "cuda"),
+        ],
+    )
     layout.addRow("Device:", device)
 
-    language = QComboBox()
-    language.addItem("Auto-detect", None)
-    for code, name in LANGUAGES:
-        language.addItem(name, code)
+    language = _make_combo()
+    _fill_combo(language, _LANGUAGE_ITEMS)
     layout.addRow("Language:", language)
 
     auto_paste = QCheckBox("Auto paste result into active cursor")
     layout.addRow("", auto_paste)
 
-    overlay_theme = QComboBox()
-    for theme in OVERLAY_THEMES:
-        overlay_theme.addItem(theme.title(), theme)
+    overlay_theme = _make_combo()
+    _fill_combo(overlay_theme, [(theme.title(), theme) for theme in OVERLAY_THEMES])
     layout.addRow("Overlay theme:", overlay_theme)
 
     overlay_opacity = QSlider(Qt.Orientation.Horizontal)
@@ -1,12 +1,14 @@
 """Theme helpers for UI components."""
 
-from PyQt6.QtGui import QColor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
+from PyQt6.QtGui import QColor
 
-def get_overlay_palette(theme: str) -> dict:
-    """Return palette dict for overlay."""
-    if theme == "light":
-        return {
+_PALETTES = {
+    "light": MappingProxyType(
+        {
             "bg": QColor(248, 248, 248, 235),
             "text": "#1e1e1e",
             "muted": "rgba(0, 0, 0, 180)",
@@ -15,12 +17,52 @@ def get_overlay_palette(theme: str) -> dict:
             "bar_bg": "rgba(0, 0, 0, 40)",
             "level_bg": "rgba(0, 0, 0, 20)",
         }
-    return {
-        "bg": QColor(14, 14, 18, 230),
-        "text": "#f5f5f5",
-        "muted": "rgba(255, 255, 255, 190)",
-        "hint": "rgba(255, 255, 255, 170)",
-        "accent": "#4cc2ff",
-        "bar_bg": "rgba(255, 255, 255, 60)",
-        "level_bg": "rgba(255, 255, 255, 35)",
-    }
+    ),
+    "dark": MappingProxyType(
+        {
+            "bg": QColor(14, 14, 18, 230),
+            "text": "#f5f5f5",
+            "muted": "rgba(255, 255, 255, 190)",
+            "hint": "rgba(255, 255, 255, 170)",
+            "accent": "#4cc2ff",
+            "bar_bg": "rgba(255, 255, 255, 60)",
+            "level_bg": "rgba(255, 255, 255, 35)",
+        }
+    ),
+}
+
+
+def get_overlay_palette(theme: str) -> Mapping:
+    """Return the (shared, read-only) palette for the overlay."""
+    return _PALETTES.get(theme, _PALETTES["dark"])
+
+
+@lru_cache(maxsize=2)
+def get_overlay_stylesheet(theme: str) -> str:
+    """Return the overlay's root stylesheet, keyed on child object names."""
+    c = get_overlay_palette(theme)
+    return (
+        f"#overlayLabel{{color:{c['text']};}}"
+        f"#overlayDetail{{color:{c['muted']};font-size:11px;}}"
+        f"#overlayText{{background:transparent;color:{c['text']};border:none;}}"
+        f"#overlayProgress{{background-color:{c['bar_bg']};border-radius:4px;}}"
+        f"#overlayProgress::chunk{{background-color:{c['accent']};border-radius:4px;}}"
+        f"#overlayLevel{{background-color:{c['level_bg']};border-radius:2px;}}"
+        f"#overlayLevel::chunk{{background-color:{c['accent']};border-radius:2px;}}"
+        f"#overlayStats{{color:{c['muted']};font-size:10px;}}"
+        f"#overlayAction{{color:{c['text']};background:transparent;border:1px solid {c['bar_bg']};"
+        f"border-radius:6px;padding:4px 10px;}}#overlayAction:hover{{background:{c['bar_bg']};}}"
+        f"#overlayAutoPaste{{color:{c['text']};}}"
+    )
+
+
+@lru_cache(maxsize=2)
+def get_record_button_style(recording: bool) -> tuple:
+    """Return (stylesheet, base colour) for the overlay record button."""
+    base = "#b71c1c" if recording else "#e53935"
+    style = (
+        f"QPushButton{{color:{'#fff' if recording else base};background:{base if recording else 'rgba(229,57,53,0.12)'};"
+        f"border:1px solid {base};border-radius:6px;padding:6px 14px;font-weight:600;}}"
+        f"QPushButton:hover{{background:{'#c62828' if recording else '#e53935'};color:#fff;}}"
+    )
+    return style, base
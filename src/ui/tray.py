@@ -1,7 +1,8 @@
 """System tray setup and helpers."""
 
-from typing import Callable, Dict
-from PyQt6.QtGui import QIcon, QAction, QPainter, QPixmap, QColor, QPen
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+from PyQt6.QtGui import QIcon, QAction, QActionGroup, QPainter, QPixmap, QColor, QPen
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu
 
@@ -9,6 +10,50 @@ from ..config import APP_NAME, AVAILABLE_MODELS
 from ..meta import APP_VERSION
 
 
+def _build_base_icon() -> QIcon:
+    icon = QIcon.fromTheme("audio-input-microphone")
+    if not icon.isNull():
+        return icon
+
+    # Simple fallback mic glyph
+    pixmap = QPixmap(64, 64)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setBrush(QColor(55, 55, 60))
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawEllipse(6, 6, 52, 52)
+    painter.setBrush(QColor(235, 235, 235))
+    painter.drawRoundedRect(26, 16, 12, 24, 4, 4)
+    painter.drawRect(28, 38, 8, 10)
+    painter.setPen(QPen(QColor(235, 235, 235), 3))
+    painter.drawLine(32, 48, 32, 56)
+    painter.drawArc(18, 42, 28, 18, 0, 180 * 16)
+    painter.end()
+    return QIcon(pixmap)
+
+
+def _icon_with_badge(base_icon: QIcon) -> QIcon:
+    pixmap = base_icon.pixmap(64, 64)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setBrush(QColor(220, 50, 50))
+    painter.setPen(Qt.PenStyle.NoPen)
+    size = 14
+    painter.drawEllipse(
+        pixmap.width() - size - 6, pixmap.height() - size - 6, size, size
+    )
+    painter.end()
+    return QIcon(pixmap)
+
+
+@lru_cache(maxsize=1)
+def _tray_icons() -> Tuple[QIcon, QIcon]:
+    """(idle, recording) tray icons, painted once per process."""
+    base = _build_base_icon()
+    return base, _icon_with_badge(base)
+
+
 class TrayController:
     def __init__(
         self,
@@ -38,58 +83,20 @@ class TrayController:
         self._base_icon: QIcon | None = None
         self._recording_icon: QIcon | None = None
         self._is_recording: bool = False
-
-    def _build_base_icon(self) -> QIcon:
-        icon = QIcon.fromTheme("audio-input-microphone")
-        if not icon.isNull():
-            return icon
-
-        # Simple fallback mic glyph
-        pixmap = QPixmap(64, 64)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QColor(55, 55, 60))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(6, 6, 52, 52)
-        painter.setBrush(QColor(235, 235, 235))
-        painter.drawRoundedRect(26, 16, 12, 24, 4, 4)
-        painter.drawRect(28, 38, 8, 10)
-        painter.setPen(QPen(QColor(235, 235, 235), 3))
-        painter.drawLine(32, 48, 32, 56)
-        painter.drawArc(18, 42, 28, 18, 0, 180 * 16)
-        painter.end()
-        return QIcon(pixmap)
-
-    def _icon_with_badge(self, base_icon: QIcon) -> QIcon:
-        pixmap = base_icon.pixmap(64, 64)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QColor(220, 50, 50))
-        painter.setPen(Qt.PenStyle.NoPen)
-        size = 14
-        painter.drawEllipse(
-            pixmap.width() - size - 6, pixmap.height() - size - 6, size, size
-        )
-        painter.end()
-        return QIcon(pixmap)
+        self._icon_recording: Optional[bool] = None  # state the tray icon shows
 
     def _apply_icon(self, recording: bool):
-        if not self.tray:
+        if not self.tray or recording == self._icon_recording:
             return
+        self._icon_recording = recording
         icon = self._recording_icon if recording else self._base_icon
-        # Force a full reset on idle to avoid stale cached badges
-        if not recording and self.tray:
-            blank = QIcon(QPixmap(64, 64))
-            self.tray.setIcon(blank)
         if icon:
-            self.tray.setIcon(QIcon(icon.pixmap(64, 64)))
+            self.tray.setIcon(icon)
         self._is_recording = recording
 
     def setup_tray(self):
         self.tray = QSystemTrayIcon(self._app)
-        self._base_icon = self._build_base_icon()
-        self._recording_icon = self._icon_with_badge(self._base_icon)
+        self._base_icon, self._recording_icon = _tray_icons()
         self._apply_icon(False)
 
         self.tray.setToolTip(f"{APP_NAME} v{APP_VERSION}")
@@ -100,23 +107,28 @@ class TrayController:
         menu.addAction(self._toggle_action)
         menu.addSeparator()
 
+        # One triggered(QAction) connection per menu; the action carries its value.
         model_menu = menu.addMenu("Model")
+        model_group = QActionGroup(model_menu)
+        model_group.triggered.connect(self._model_action_triggered)
         for model in AVAILABLE_MODELS:
             action = QAction(model, model_menu)
             action.setCheckable(True)
             action.setChecked(model == self._current_model)
-            action.triggered.connect(lambda checked, m=model: self._on_model_select(m))
+            action.setData(model)
+            model_group.addAction(action)
             self._model_actions[model] = action
             model_menu.addAction(action)
 
         device_menu = menu.addMenu("Device")
+        device_group = QActionGroup(device_menu)
+        device_group.triggered.connect(self._device_action_triggered)
         for device in ["auto", "cpu", "cuda"]:
             action = QAction(device.upper(), device_menu)
             action.setCheckable(True)
             action.setChecked(device == self._current_device)
-            action.triggered.connect(
-                lambda checked, d=device: self._on_device_select(d)
-            )
+            action.setData(device)
+            device_group.addAction(action)
             self._device_actions[device] = action
             device_menu.addAction(action)
 
@@ -140,6 +152,12 @@ class TrayController:
         self.tray.activated.connect(self._handle_activation)
         self.tray.show()
 
+    def _model_action_triggered(self, action: QAction):
+        self._on_model_select(action.data())
+
+    def _device_action_triggered(self, action: QAction):
+        self._on_device_select(action.data())
+
     def _handle_activation(self, reason):
         if reason == QSystemTrayIcon.ActivationReason.Trigger:
             self._on_toggle()
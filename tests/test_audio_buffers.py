@@ -0,0 +1,71 @@
+import numpy as np
+
+from src.audio.buffers import AudioArena, RingBuffer
+
+
+def _frame(start: int, n: int) -> np.ndarray:
+    return np.arange(start, start + n, dtype=np.float32)
+
+
+def test_audio_arena_appends_across_growth():
+    arena = AudioArena(4)
+
+    arena.append(_frame(0, 3))
+    arena.append(_frame(3, 3))
+    arena.append(_frame(6, 10))
+
+    assert len(arena) == 16
+    np.testing.assert_array_equal(arena.view(), _frame(0, 16))
+
+
+def test_audio_arena_view_after_growth():
+    arena = AudioArena(0)
+    expected = []
+
+    for i in range(20):
+        frame = _frame(i * 7, 7)
+        arena.append(frame)
+        expected.append(frame)
+        np.testing.assert_array_equal(arena.view(), np.concatenate(expected))
+
+    view = arena.view()
+    assert view.dtype == np.float32
+    assert view.shape == (140,)
+
+
+def test_ring_buffer_wraps_around():
+    ring = RingBuffer(8)
+
+    ring.push(_frame(0, 5))
+    ring.push(_frame(5, 5))
+
+    assert len(ring) == 8
+    np.testing.assert_array_equal(ring.to_array(), _frame(2, 8))
+
+
+def test_ring_buffer_keeps_tail_of_oversized_write():
+    ring = RingBuffer(8)
+    ring.push(_frame(0, 3))
+
+    ring.push(_frame(3, 20))
+
+    assert len(ring) == 8
+    np.testing.assert_array_equal(ring.to_array(), _frame(15, 8))
+
+    ring.push(_frame(23, 2))
+    np.testing.assert_array_equal(ring.to_array(), _frame(17, 8))
+
+
+def test_ring_buffer_drain_into_keeps_order():
+    ring = RingBuffer(8)
+    arena = AudioArena(4)
+    arena.append(_frame(-3, 3))
+    ring.push(_frame(0, 6))
+    ring.push(_frame(6, 5))
+
+    ring.drain_into(arena)
+
+    assert len(ring) == 0
+    np.testing.assert_array_equal(
+        arena.view(), np.concatenate([_frame(-3, 3), _frame(3, 8)])
+    )
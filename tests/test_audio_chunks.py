@@ -4,55 +4,82 @@ from src.audio.chunks import emit_chunk_if_ready
 
 
 def test_emit_chunk_if_ready_respects_interval():
-    buffers = [np.zeros(100, dtype=np.float32)]
+    audio = np.zeros(100, dtype=np.float32)
     emitted = []
 
-    last_time, last_index = emit_chunk_if_ready(
-        buffers=buffers,
-        last_time=1.0,
+    last_index = emit_chunk_if_ready(
+        audio=audio,
         last_index=0,
-        current_time=1.5,
         chunk_interval=1.0,
         sample_rate=16000,
         on_audio_chunk=lambda chunk: emitted.append(chunk),
     )
 
     assert emitted == []
-    assert last_time == 1.0
     assert last_index == 0
 
 
+def test_emit_chunk_if_ready_counts_interval_in_samples():
+    # Only 1.5s of new audio: below the 2s interval, whatever the wall clock says.
+    audio = np.zeros(16000 + 24000, dtype=np.float32)
+    emitted = []
+
+    last_index = emit_chunk_if_ready(
+        audio=audio,
+        last_index=16000,
+        chunk_interval=2.0,
+        sample_rate=16000,
+        on_audio_chunk=lambda chunk: emitted.append(chunk),
+    )
+
+    assert emitted == []
+    assert last_index == 16000
+
+
+def test_emit_chunk_if_ready_first_chunk_after_one_second():
+    emitted = []
+
+    def emit(samples):
+        return emit_chunk_if_ready(
+            audio=np.zeros(samples, dtype=np.float32),
+            last_index=0,
+            chunk_interval=2.0,
+            sample_rate=16000,
+            on_audio_chunk=lambda chunk: emitted.append(chunk),
+        )
+
+    # The first chunk ignores the 2s interval and only needs more than 1s.
+    assert emit(16000) == 0
+    assert emitted == []
+    assert emit(16001) == 16001
+    assert len(emitted) == 1
+
+
 def test_emit_chunk_if_ready_requires_samples():
-    buffers = [np.zeros(100, dtype=np.float32)]
+    audio = np.zeros(100, dtype=np.float32)
     emitted = []
 
-    last_time, last_index = emit_chunk_if_ready(
-        buffers=buffers,
-        last_time=0.0,
+    last_index = emit_chunk_if_ready(
+        audio=audio,
         last_index=0,
-        current_time=2.0,
         chunk_interval=1.0,
         sample_rate=16000,
         on_audio_chunk=lambda chunk: emitted.append(chunk),
     )
 
     assert emitted == []
-    assert last_time == 0.0
     assert last_index == 0
 
 
-def test_emit_chunk_if_ready_emits_concatenated_audio():
-    buffers = [
-        np.ones(16000, dtype=np.float32),
-        np.ones(16000, dtype=np.float32) * 2.0,
-    ]
+def test_emit_chunk_if_ready_emits_copy_of_recorded_audio():
+    audio = np.concatenate(
+        [np.ones(16000, dtype=np.float32), np.ones(16000, dtype=np.float32) * 2.0]
+    )
     emitted = []
 
-    last_time, last_index = emit_chunk_if_ready(
-        buffers=buffers,
-        last_time=0.0,
+    last_index = emit_chunk_if_ready(
+        audio=audio,
         last_index=0,
-        current_time=2.5,
         chunk_interval=1.0,
         sample_rate=16000,
         on_audio_chunk=lambda chunk: emitted.append(chunk),
@@ -62,8 +89,24 @@ def test_emit_chunk_if_ready_emits_concatenated_audio():
     assert emitted[0].shape[0] == 32000
     assert emitted[0][0] == 1.0
     assert emitted[0][16000] == 2.0
-    assert last_time == 2.5
     assert last_index == 32000
 
-    buffers[0][0] = 9.0
+    audio[0] = 9.0
     assert emitted[0][0] == 1.0
+
+
+def test_emit_chunk_if_ready_can_emit_view():
+    audio = np.ones(32000, dtype=np.float32)
+    emitted = []
+
+    emit_chunk_if_ready(
+        audio=audio,
+        last_index=0,
+        chunk_interval=1.0,
+        sample_rate=16000,
+        on_audio_chunk=lambda chunk: emitted.append(chunk),
+        copy=False,
+    )
+
+    assert len(emitted) == 1
+    assert np.shares_memory(emitted[0], audio)
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from src.audio.levels import frame_peak, frame_rms
+
+
+def test_frame_rms_matches_mean_square_reference():
+    rng = np.random.default_rng(0)
+    audio = rng.uniform(-1.0, 1.0, 480).astype(np.float32)
+
+    expected = float(np.sqrt(np.mean(audio**2)))
+
+    assert frame_rms(audio) == pytest.approx(expected, rel=1e-5)
+
+
+def test_frame_rms_empty_frame_is_silent():
+    assert frame_rms(np.zeros(0, dtype=np.float32)) == 0.0
+
+
+def test_frame_peak_uses_magnitude():
+    audio = np.array([0.2, -0.9, 0.5], dtype=np.float32)
+
+    assert frame_peak(audio) == pytest.approx(0.9)
@@ -1,8 +1,10 @@
 import json
+from dataclasses import asdict
 
 import pytest
 
 from src import config as config_module
+from src import config_validation
 
 
 @pytest.fixture()
@@ -23,12 +25,20 @@ def config_paths(tmp_path, monkeypatch):
     return config_file
 
 
+@pytest.fixture()
+def stdlib_json(monkeypatch):
+    # orjson rejects Infinity/NaN outright; stdlib json parses them as floats.
+    monkeypatch.setattr(config_validation, "orjson", None)
+
+
 def test_settings_validate_clamps_values():
     settings = config_module.Settings(
         vad_silence_timeout=0.1,
         vad_threshold=99,
         model_size="nope",
         device="gpu",
+        compute_type="int4",
+        streaming_beam_size=0,
         max_recording_sec=2,
         overlay_theme="neon",
         overlay_opacity=2.5,
@@ -41,12 +51,75 @@ def test_settings_validate_clamps_values():
     assert settings.vad_threshold == 3
     assert settings.model_size == "medium"
     assert settings.device == "auto"
+    assert settings.compute_type == "auto"
+    assert settings.streaming_beam_size == 1
     assert settings.max_recording_sec == 5.0
     assert settings.overlay_theme == "auto"
     assert settings.overlay_opacity == 1.0
     assert settings.auto_paste is False
 
 
+def test_settings_validate_resets_non_numeric_values():
+    settings = config_module.Settings(
+        vad_silence_timeout="slow", overlay_opacity=None, max_recording_sec="abc"
+    )
+
+    settings.validate()
+
+    assert settings.vad_silence_timeout == 1.5
+    assert settings.overlay_opacity == 0.8
+    assert settings.max_recording_sec is None
+
+
+def test_config_manager_resets_non_finite_recording_limit(config_paths, stdlib_json):
+    config_paths.parent.mkdir(parents=True, exist_ok=True)
+    config_paths.write_text(
+        '{"max_recording_sec": Infinity, "vad_threshold": 3}', encoding="utf-8"
+    )
+
+    loaded = config_module.ConfigManager().load()
+
+    assert loaded.max_recording_sec is None
+    assert loaded.vad_threshold == 3
+
+    settings = config_module.Settings(max_recording_sec=float("nan"))
+    settings.validate()
+    assert settings.max_recording_sec is None
+
+
+def test_config_manager_clamps_non_finite_ranges(config_paths, stdlib_json):
+    config_paths.parent.mkdir(parents=True, exist_ok=True)
+    config_paths.write_text(
+        '{"vad_threshold": Infinity, "streaming_beam_size": -1e400,'
+        ' "overlay_opacity": NaN, "max_recording_sec": 1'
+        + "0" * 400
+        + "}",
+        encoding="utf-8",
+    )
+
+    loaded = config_module.ConfigManager().load()
+
+    assert loaded.vad_threshold == 3
+    assert isinstance(loaded.vad_threshold, int)
+    assert loaded.streaming_beam_size == 1
+    assert loaded.overlay_opacity == 0.8
+    assert loaded.max_recording_sec is None
+
+
+def test_config_manager_resets_unhashable_choice(config_paths):
+    config_paths.parent.mkdir(parents=True, exist_ok=True)
+    config_paths.write_text(
+        json.dumps({"model_size": [], "device": {}, "vad_threshold": 1}),
+        encoding="utf-8",
+    )
+
+    loaded = config_module.ConfigManager().load()
+
+    assert loaded.model_size == "medium"
+    assert loaded.device == "auto"
+    assert loaded.vad_threshold == 1
+
+
 def test_config_manager_loads_and_saves(config_paths):
     manager = config_module.ConfigManager()
     settings = config_module.Settings(model_size="tiny", vad_silence_timeout=2.0)
@@ -59,6 +132,18 @@ def test_config_manager_loads_and_saves(config_paths):
     assert loaded.vad_silence_timeout == 2.0
 
 
+def test_config_manager_skips_unchanged_save(config_paths):
+    manager = config_module.ConfigManager()
+    manager.save(config_module.Settings(model_size="tiny"))
+    inode = config_paths.stat().st_ino
+
+    manager.save(config_module.Settings(model_size="tiny"))
+    assert config_paths.stat().st_ino == inode
+
+    manager.save(config_module.Settings(model_size="small"))
+    assert manager.load().model_size == "small"
+
+
 def test_config_manager_ignores_unknown_keys(config_paths):
     config_paths.parent.mkdir(parents=True, exist_ok=True)
     config_paths.write_text(
@@ -81,3 +166,21 @@ def test_config_manager_invalid_json_returns_defaults(config_paths):
     loaded = manager.load()
 
     assert loaded.model_size == "medium"
+
+
+def test_config_manager_update_coalesces_writes(config_paths):
+    manager = config_module.ConfigManager()
+    manager.update(model_size="tiny")
+    manager.update(model_size="small")
+
+    assert not config_paths.exists()
+
+    manager.flush()
+
+    assert json.loads(config_paths.read_text(encoding="utf-8"))["model_size"] == "small"
+
+
+def test_settings_dict_matches_asdict():
+    # save() serializes a flat field mapping; nested dataclasses would break that.
+    settings = config_module.Settings()
+    assert config_module._settings_dict(settings) == asdict(settings)
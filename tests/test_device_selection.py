@@ -0,0 +1,47 @@
+import sys
+
+import pytest
+
+from src.config import config
+from src.model import device_selection, loading
+
+
+@pytest.fixture(autouse=True)
+def fresh_detect_device():
+    device_selection.detect_device.cache_clear()
+    yield
+    device_selection.detect_device.cache_clear()
+
+
+def test_detect_device_cpu_preference():
+    assert device_selection.detect_device("cpu") == ("cpu", "int8")
+
+
+def test_detect_device_hidden_gpus_fall_back_to_cpu(monkeypatch):
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "")
+    assert device_selection.detect_device("auto") == ("cpu", "int8")
+
+
+@pytest.fixture
+def supported_types(monkeypatch):
+    types = {"cpu": {"int8", "float32"}, "cuda": {"float16", "float32"}}
+    fake = type(sys)("ctranslate2")
+    fake.get_supported_compute_types = lambda device: types[device]
+    monkeypatch.setitem(sys.modules, "ctranslate2", fake)
+    return types
+
+
+def test_resolve_compute_type_rejects_float16_on_cpu(monkeypatch, supported_types):
+    monkeypatch.setattr(config.settings, "compute_type", "float16")
+    assert loading.resolve_compute_type("cpu", "int8") == "int8"
+    assert loading.resolve_compute_type("cuda", "float16") == "float16"
+
+
+def test_resolve_compute_type_skips_int8_on_gpus_without_it(
+    monkeypatch, supported_types
+):
+    monkeypatch.setattr(config.settings, "compute_type", "auto")
+    assert loading.resolve_compute_type("cuda", "float16") == "float16"
+
+    supported_types["cuda"].add("int8_float16")
+    assert loading.resolve_compute_type("cuda", "float16") == "int8_float16"
@@ -1,6 +1,15 @@
+import pytest
+
 from src import config
 
 
+@pytest.fixture(autouse=True)
+def fresh_display_server():
+    config.invalidate_display_server_cache()
+    yield
+    config.invalidate_display_server_cache()
+
+
 def test_is_wayland_from_session_type(monkeypatch):
     monkeypatch.setenv("XDG_SESSION_TYPE", "wayland")
     assert config.is_wayland() is True
@@ -20,7 +29,17 @@ def test_get_display_server_fallbacks(monkeypatch):
 
     monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
     monkeypatch.setenv("DISPLAY", ":0")
+    config.invalidate_display_server_cache()
     assert config.get_display_server() == "x11"
 
     monkeypatch.delenv("DISPLAY", raising=False)
+    config.invalidate_display_server_cache()
     assert config.get_display_server() == "unknown"
+
+
+def test_get_display_server_is_cached(monkeypatch):
+    monkeypatch.setenv("XDG_SESSION_TYPE", "x11")
+    assert config.get_display_server() == "x11"
+
+    monkeypatch.setenv("XDG_SESSION_TYPE", "wayland")
+    assert config.get_display_server() == "x11"
@@ -0,0 +1,16 @@
+from src.system import acquire_lock, release_lock
+
+
+def test_second_acquire_fails_and_keeps_owner_pid(tmp_path):
+    lock_file = tmp_path / "app.lock"
+    first = acquire_lock(lock_file)
+    assert first is not None
+    pid = lock_file.read_text()
+
+    assert acquire_lock(lock_file) is None
+    assert lock_file.read_text() == pid
+
+    release_lock(first, lock_file)
+    second = acquire_lock(lock_file)
+    assert second is not None
+    release_lock(second, lock_file)
@@ -36,3 +36,21 @@ def test_remove_model_cache_removes_matches(tmp_path, monkeypatch):
     assert not match_b.exists()
     assert keep.exists()
     assert model_cache.remove_model_cache("tiny") is False
+
+
+def test_model_listing_picks_up_new_directories(tmp_path, monkeypatch):
+    models_dir = _setup_models_dir(tmp_path, monkeypatch)
+
+    assert model_cache.is_model_cached("base") is False
+
+    (models_dir / "base").mkdir()
+
+    assert model_cache.is_model_cached("base") is True
+
+
+def test_list_cached_models_keeps_hyphenated_sizes(tmp_path, monkeypatch):
+    models_dir = _setup_models_dir(tmp_path, monkeypatch)
+    (models_dir / "models--Systran--faster-whisper-large-v3").mkdir()
+    (models_dir / "models--Systran--faster-whisper-tiny").mkdir()
+
+    assert model_cache.list_cached_models() == {"large-v3", "tiny"}
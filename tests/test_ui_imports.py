@@ -0,0 +1,17 @@
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_importing_ui_package_does_not_load_qt():
+    code = "import sys, src.ui; print(any(m.startswith('PyQt6') for m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_ROOT,
+    )
+    assert result.stdout.strip() == "False"
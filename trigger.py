@@ -14,7 +14,6 @@ This script is designed to be bound to a system hotkey.
 """
 
 import sys
-import time
 
 # IPC socket name (must match app)
 IPC_SOCKET_NAME = "whisper-wrapper-ipc"
@@ -31,72 +30,99 @@ def send_command(command: str = "toggle", retries: int = 3) -> tuple[bool, str]:
     Returns:
         Tuple of (success, response)
     """
+    # A raw Unix socket avoids loading Qt, which dominates this script's runtime.
+    # Qt is only tried when no socket accepted the connection; once a command
+    # is sent, retrying elsewhere could deliver it twice.
+    result = send_command_socket(command)
+    if result is not None:
+        return result
+
     try:
         from PyQt6.QtNetwork import QLocalSocket
         from PyQt6.QtCore import QCoreApplication
+    except ImportError:
+        return False, "Could not connect to Whisper app"
 
-        # Need QCoreApplication for Qt networking
-        app = QCoreApplication.instance()
-        if app is None:
-            app = QCoreApplication(sys.argv)
-
-        for attempt in range(retries):
-            socket = QLocalSocket()
-            socket.connectToServer(IPC_SOCKET_NAME)
+    # Need QCoreApplication for Qt networking
+    app = QCoreApplication.instance()
+    if app is None:
+        app = QCoreApplication(sys.argv)
+
+    # Short first waits fail fast when the app is not running; later
+    # attempts give a starting app more time.
+    timeouts = (200, 500, 1000)
+    socket = QLocalSocket()
+    for attempt in range(retries):
+        socket.abort()
+        socket.connectToServer(IPC_SOCKET_NAME)
+
+        if socket.waitForConnected(timeouts[min(attempt, len(timeouts) - 1)]):
+            socket.write(command.encode())
+            socket.flush()
+
+            if socket.waitForReadyRead(2000):
+                response = socket.readAll().data().decode("utf-8")
+                socket.disconnectFromServer()
+                return True, response
 
-            if socket.waitForConnected(1000):
-                socket.write(command.encode())
-                socket.flush()
+            socket.disconnectFromServer()
+            return True, "ok"
 
-                if socket.waitForReadyRead(2000):
-                    response = socket.readAll().data().decode("utf-8")
-                    socket.disconnectFromServer()
-                    return True, response
+        # Retry with backoff
+        if attempt < retries - 1:
+            import time
 
-                socket.disconnectFromServer()
-                return True, "ok"
+            time.sleep(0.1 * (attempt + 1))
 
-            # Retry with backoff
-            if attempt < retries - 1:
-                time.sleep(0.1 * (attempt + 1))
+    return False, "Could not connect to Whisper app"
 
-        return False, "Could not connect to Whisper app"
-
-    except ImportError:
-        # Fallback to pure Python socket if PyQt6 not available
-        return send_command_socket(command)
 
+def send_command_socket(command: str = "toggle") -> tuple[bool, str] | None:
+    """
+    Send a command over the Unix socket directly, without Qt.
 
-def send_command_socket(command: str = "toggle") -> tuple[bool, str]:
-    """Fallback using Unix socket directly."""
+    Returns None if no socket accepted the connection, else (success, response).
+    """
     import socket
     import os
 
-    # Try common socket locations
-    socket_paths = [
-        f"/tmp/{IPC_SOCKET_NAME}",
-        f"/run/user/{os.getuid()}/{IPC_SOCKET_NAME}",
-        os.path.expanduser(f"~/.cache/{IPC_SOCKET_NAME}"),
-    ]
-
-    # QLocalServer creates sockets in XDG_RUNTIME_DIR or /tmp
+    # QLocalServer creates sockets in QDir::tempPath(), i.e. $TMPDIR or /tmp,
+    # so that goes first; the rest are common alternatives.
+    temp_dir = os.environ.get("TMPDIR", "").rstrip("/") or "/tmp"
     runtime_dir = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
-    socket_paths.insert(0, f"{runtime_dir}/{IPC_SOCKET_NAME}")
-
+    socket_paths = dict.fromkeys(
+        [
+            f"{temp_dir}/{IPC_SOCKET_NAME}",
+            f"{runtime_dir}/{IPC_SOCKET_NAME}",
+            f"/tmp/{IPC_SOCKET_NAME}",
+            f"/run/user/{os.getuid()}/{IPC_SOCKET_NAME}",
+            os.path.expanduser(f"~/.cache/{IPC_SOCKET_NAME}"),
+        ]
+    )
+
+    # connect() on a missing path fails fast, so no separate exists() probe.
     for socket_path in socket_paths:
-        if os.path.exists(socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(2)
             try:
-                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                sock.settimeout(2)
                 sock.connect(socket_path)
-                sock.send(command.encode())
-                response = sock.recv(1024).decode("utf-8")
-                sock.close()
-                return True, response
-            except Exception:
+            except OSError:
                 continue
+            try:
+                sock.sendall(command.encode())
+            except OSError as e:
+                return False, f"Failed to send command: {e}"
+            # The server closes after replying, so read until EOF. Like the Qt
+            # path, a sent command without a reply (busy app) still counts.
+            response = bytearray()
+            try:
+                while chunk := sock.recv(1024):
+                    response += chunk
+            except OSError:
+                pass
+            return True, response.decode("utf-8", errors="replace") or "ok"
 
-    return False, "Could not connect to Whisper app"
+    return None
 
 
 def main():